@@ -62,19 +62,26 @@ class ImageGenerationService:
         # Reference image for style consistency across generations.
         # Populated from the first successful generation and persisted to disk.
         self._reference_image_path = self.images_dir / REFERENCE_IMAGE_FILENAME
-        self._reference_image_bytes: Optional[bytes] = None
-        if self._reference_image_path.exists():
-            age = datetime.now() - datetime.fromtimestamp(
-                self._reference_image_path.stat().st_mtime
+        self._reference_image_bytes: Optional[bytes] = self._load_reference_image()
+
+    def _load_reference_image(self) -> Optional[bytes]:
+        """Load the persisted style reference if it exists and has not expired.
+
+        Returns:
+            PNG bytes of the reference image, or None when it is missing or older
+            than REFERENCE_MAX_AGE_DAYS.
+        """
+        if not self._reference_image_path.exists():
+            return None
+        age = datetime.now() - datetime.fromtimestamp(self._reference_image_path.stat().st_mtime)
+        if age >= timedelta(days=REFERENCE_MAX_AGE_DAYS):
+            logger.info(
+                "Reference image expired (%d days old), will regenerate on next call",
+                age.days,
             )
-            if age < timedelta(days=REFERENCE_MAX_AGE_DAYS):
-                self._reference_image_bytes = self._reference_image_path.read_bytes()
-                logger.debug("Loaded reference image from %s", self._reference_image_path)
-            else:
-                logger.info(
-                    "Reference image expired (%d days old), will regenerate on next call",
-                    age.days,
-                )
+            return None
+        logger.debug("Loaded reference image from %s", self._reference_image_path)
+        return self._reference_image_path.read_bytes()
 
     def build_prompt(self, request: ImageGenerationRequest, has_reference: bool = False) -> str:
         """Build a Gemini Image API prompt from request and character config.
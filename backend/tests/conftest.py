@@ -1,10 +1,136 @@
-"""Shared test fixtures and configuration."""
+"""Shared test fixtures and configuration.
+
+Session-scoped fixtures are created once per pytest-xdist worker. They hold
+no files, sockets or external connections, so workers never contend for them.
+Imports that pull in Vertex AI / ADK / Firestore live inside the fixtures that
+need them, so pure unit-test modules don't pay for them when conftest loads.
+"""
+import re
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock
+
 import pytest
+from fastapi import FastAPI
+
+from app.models.image import CharacterConfig
+
+if TYPE_CHECKING:
+    from fastapi.testclient import TestClient
+
+    from app.services.agent import ChatAgent
+
+_TEST_ENV: dict[str, str] = {
+    "GCP_PROJECT_ID": "test-project",
+    "VERTEX_AI_LOCATION": "us-central1",
+    "AGENT_ENGINE_ID": "test-agent-123",
+}
 
 
 @pytest.fixture(autouse=True)
 def set_required_env_vars(monkeypatch: pytest.MonkeyPatch) -> None:
     """Set required GCP environment variables for all tests."""
-    monkeypatch.setenv("GCP_PROJECT_ID", "test-project")
-    monkeypatch.setenv("VERTEX_AI_LOCATION", "us-central1")
-    monkeypatch.setenv("AGENT_ENGINE_ID", "test-agent-123")
+    for key, value in _TEST_ENV.items():
+        monkeypatch.setenv(key, value)
+
+
+@pytest.fixture(scope="session")
+def app() -> FastAPI:
+    """FastAPI app imported once per session.
+
+    app.main reads settings at import time, which happens before the
+    function-scoped env fixture runs, so the test env is applied here too.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        for key, value in _TEST_ENV.items():
+            mp.setenv(key, value)
+        from app.main import app as fastapi_app
+    return fastapi_app
+
+
+@pytest.fixture(scope="session")
+def character_config() -> CharacterConfig:
+    """Sample character config shared across the session; tests must not mutate it."""
+    return CharacterConfig(
+        name="あかり",
+        personality="明るく元気な女の子。好奇心旺盛で、新しいことに挑戦するのが好き。",
+        appearance_prompt="anime style girl, long black hair, blue eyes, school uniform",
+    )
+
+
+@pytest.fixture(scope="session")
+def agent(character_config: CharacterConfig) -> "ChatAgent":
+    """Uninitialized ChatAgent shared across the session.
+
+    Only for read-only checks; tests that set _adk_app must build their own.
+    """
+    from app.services.agent import ChatAgent
+
+    return ChatAgent("p", "l", "e", character_config)
+
+
+@pytest.fixture(scope="session")
+def system_instructions(agent: "ChatAgent") -> str:
+    """System instructions built once; the prompt only depends on character_config."""
+    return agent._build_system_instructions()
+
+
+@pytest.fixture(scope="session")
+def instruction_tokens(system_instructions: str) -> frozenset[str]:
+    """ASCII identifiers in the system instructions, for whole-token membership checks."""
+    return frozenset(re.findall(r"[A-Za-z_][A-Za-z_0-9]*", system_instructions))
+
+
+@pytest.fixture(scope="session")
+def mock_service() -> MagicMock:
+    """ConversationService mock shared across the session.
+
+    Spec'd against ConversationService so async methods come back as AsyncMock.
+    Modules using it are responsible for resetting it before each test.
+    """
+    from app.services.conversation import ConversationService
+
+    return MagicMock(spec=ConversationService)
+
+
+@pytest.fixture(scope="session")
+def _app_client(app: FastAPI) -> "TestClient":
+    """TestClient shared across the session.
+
+    Not entered as a context manager, so the lifespan (real ChatAgent
+    initialization) never runs and app.state stays empty unless a test sets it.
+    """
+    from fastapi.testclient import TestClient
+
+    return TestClient(app)
+
+
+@pytest.fixture
+def client(
+    _app_client: "TestClient",
+    app: FastAPI,
+    mock_service: MagicMock,
+    monkeypatch: pytest.MonkeyPatch,
+) -> "TestClient":
+    """Shared TestClient with get_conversation_service overridden to mock_service."""
+    from app.api.conversation import get_conversation_service
+
+    monkeypatch.setitem(
+        app.dependency_overrides, get_conversation_service, lambda: mock_service
+    )
+    return _app_client
+
+
+@pytest.fixture
+def bare_client(
+    _app_client: "TestClient", app: FastAPI, monkeypatch: pytest.MonkeyPatch
+) -> "TestClient":
+    """Shared TestClient with no ConversationService reachable for the current test.
+
+    Any override or app.state service left in place is removed and restored
+    afterwards, so the shared client never has to be reopened.
+    """
+    from app.api.conversation import get_conversation_service
+
+    monkeypatch.delitem(app.dependency_overrides, get_conversation_service, raising=False)
+    monkeypatch.delattr(app.state, "conversation_service", raising=False)
+    return _app_client
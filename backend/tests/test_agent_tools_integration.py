@@ -54,7 +54,7 @@ def real_gcp_settings(monkeypatch: pytest.MonkeyPatch) -> None:
     get_settings.cache_clear()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def character_config():
     """Load character config from data/characters/character.json."""
     from app.models.image import CharacterConfig
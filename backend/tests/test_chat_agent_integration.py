@@ -11,10 +11,13 @@ Run with:
 Default test runs skip these (addopts = "-m not integration" in pyproject.toml).
 """
 import json
+import uuid
 from pathlib import Path
 
 import pytest
 
+from app.models.conversation import Emotion, Scene, StructuredResponse
+
 pytestmark = pytest.mark.integration
 
 
@@ -55,7 +58,7 @@ def real_gcp_settings(monkeypatch: pytest.MonkeyPatch) -> None:
     get_settings.cache_clear()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def character_config():
     """Load character config from data/characters/character.json."""
     from app.models.image import CharacterConfig
@@ -85,7 +88,22 @@ def chat_agent(character_config):
     return agent
 
 
-TEST_USER_ID = "integration_test_user"
+@pytest.fixture
+def test_user_id() -> str:
+    """Unique user ID per test run to avoid state pollution."""
+    return f"chat_test_{uuid.uuid4().hex[:8]}"
+
+
+@pytest.fixture(autouse=True)
+def cleanup_firestore(test_user_id: str):
+    """Delete Firestore test data before and after each test."""
+    from google.cloud import firestore
+
+    db = firestore.Client()
+    ref = db.collection("user_states").document(test_user_id)
+    ref.delete()
+    yield
+    ref.delete()
 
 
 # ---------------------------------------------------------------------------
@@ -94,12 +112,10 @@ TEST_USER_ID = "integration_test_user"
 
 
 @pytest.mark.timeout(120)
-async def test_run_returns_structured_response(chat_agent) -> None:
+async def test_run_returns_structured_response(chat_agent, test_user_id: str) -> None:
     """ChatAgent.run() should return a valid StructuredResponse from the deployed agent."""
-    from app.models.conversation import StructuredResponse
-
     response, session_id = await chat_agent.run(
-        user_id=TEST_USER_ID,
+        user_id=test_user_id,
         session_id=None,
         message="こんにちは！",
         scene="indoor",
@@ -112,12 +128,12 @@ async def test_run_returns_structured_response(chat_agent) -> None:
 
 
 @pytest.mark.timeout(120)
-async def test_all_response_fields_have_correct_types(chat_agent) -> None:
+async def test_all_response_fields_have_correct_types(
+    chat_agent, test_user_id: str
+) -> None:
     """All StructuredResponse fields should have the expected types and constraints."""
-    from app.models.conversation import Emotion, Scene
-
     response, _ = await chat_agent.run(
-        user_id=TEST_USER_ID,
+        user_id=test_user_id,
         session_id=None,
         message="今日はどんな気分ですか？",
         scene="cafe",
@@ -139,11 +155,13 @@ async def test_all_response_fields_have_correct_types(chat_agent) -> None:
 
 
 @pytest.mark.timeout(240)
-async def test_session_id_maintained_across_turns(chat_agent) -> None:
+async def test_session_id_maintained_across_turns(
+    chat_agent, test_user_id: str
+) -> None:
     """Session ID returned by run() should stay the same across multiple turns."""
     # Turn 1: session_id=None → new session created
     _, session_id_1 = await chat_agent.run(
-        user_id=TEST_USER_ID,
+        user_id=test_user_id,
         session_id=None,
         message="こんにちは",
         scene="indoor",
@@ -152,7 +170,7 @@ async def test_session_id_maintained_across_turns(chat_agent) -> None:
 
     # Turn 2: reuse session_id from turn 1
     _, session_id_2 = await chat_agent.run(
-        user_id=TEST_USER_ID,
+        user_id=test_user_id,
         session_id=session_id_1,
         message="今日はいい天気ですね",
         scene="indoor",
@@ -163,27 +181,33 @@ async def test_session_id_maintained_across_turns(chat_agent) -> None:
 
 
 @pytest.mark.timeout(240)
-async def test_multi_turn_conversation_returns_responses(chat_agent) -> None:
+async def test_multi_turn_conversation_returns_responses(
+    chat_agent, test_user_id: str
+) -> None:
     """Multiple turns in the same session should each return a valid response."""
-    from app.models.conversation import StructuredResponse
-
     messages = [
         "こんにちは！初めまして。",
         "好きな食べ物は何ですか？",
         "それは美味しそうですね！",
     ]
 
+    # Turns are strictly sequential: each run() needs the session_id returned
+    # by the previous turn, so this loop must not be parallelized or pipelined.
     session_id = None
+    responses: list[StructuredResponse] = []
     for msg in messages:
         response, session_id = await chat_agent.run(
-            user_id=TEST_USER_ID,
+            user_id=test_user_id,
             session_id=session_id,
             message=msg,
             scene="cafe",
             emotion="happy",
         )
-        assert isinstance(response, StructuredResponse)
-        assert len(response.dialogue) > 0
+        responses.append(response)
+
+    assert type(responses[0]) is StructuredResponse
+    for response in responses:
+        assert response.dialogue
 
 
 # ---------------------------------------------------------------------------
@@ -191,27 +215,24 @@ async def test_multi_turn_conversation_returns_responses(chat_agent) -> None:
 # ---------------------------------------------------------------------------
 
 
-async def test_parse_failure_falls_back_to_defaults(chat_agent) -> None:
+async def test_parse_failure_falls_back_to_defaults(
+    chat_agent, test_user_id: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
     """Invalid JSON from the stream should produce a fallback StructuredResponse."""
-    from app.models.conversation import Emotion, Scene
-
-    # Inject a mock stream that returns invalid JSON (simulates malformed response)
+    # Inject a mock stream that returns invalid JSON (simulates malformed response).
+    # monkeypatch restores the original even if the test fails before run().
     async def broken_stream(**kwargs):  # type: ignore[return]
         yield {"content": {"role": "model", "parts": [{"text": "this is not json"}]}}
 
-    original = chat_agent._adk_app.async_stream_query
-    chat_agent._adk_app.async_stream_query = broken_stream
+    monkeypatch.setattr(chat_agent._adk_app, "async_stream_query", broken_stream)
 
-    try:
-        response, _ = await chat_agent.run(
-            user_id=TEST_USER_ID,
-            session_id="dummy-session-fallback-test",
-            message="テスト",
-            scene="indoor",
-            emotion="neutral",
-        )
-    finally:
-        chat_agent._adk_app.async_stream_query = original
+    response, _ = await chat_agent.run(
+        user_id=test_user_id,
+        session_id="dummy-session-fallback-test",
+        message="テスト",
+        scene="indoor",
+        emotion="neutral",
+    )
 
     assert response.emotion == Emotion.neutral
     assert response.scene == Scene.indoor
@@ -61,10 +61,10 @@ class TestLoadCharacterConfig:
 class TestDeploy:
     """Tests for deploy() function."""
 
-    @patch("deploy_agent.vertexai.agent_engines.create")
-    @patch("deploy_agent.AdkApp")
-    @patch("deploy_agent.build_agent")
-    @patch("deploy_agent.vertexai.init")
+    @patch("vertexai.agent_engines.create")
+    @patch("vertexai.agent_engines.AdkApp")
+    @patch("app.services.agent.build_agent")
+    @patch("vertexai.init")
     def test_calls_vertexai_init(
         self,
         mock_init: MagicMock,
@@ -83,10 +83,10 @@ class TestDeploy:
 
         mock_init.assert_called_once()
 
-    @patch("deploy_agent.vertexai.agent_engines.create")
-    @patch("deploy_agent.AdkApp")
-    @patch("deploy_agent.build_agent")
-    @patch("deploy_agent.vertexai.init")
+    @patch("vertexai.agent_engines.create")
+    @patch("vertexai.agent_engines.AdkApp")
+    @patch("app.services.agent.build_agent")
+    @patch("vertexai.init")
     def test_calls_build_agent_with_custom_tools(
         self,
         mock_init: MagicMock,
@@ -110,10 +110,10 @@ class TestDeploy:
         assert update_affinity in kwargs["extra_tools"]
         assert save_to_memory in kwargs["extra_tools"]
 
-    @patch("deploy_agent.vertexai.agent_engines.create")
-    @patch("deploy_agent.AdkApp")
-    @patch("deploy_agent.build_agent")
-    @patch("deploy_agent.vertexai.init")
+    @patch("vertexai.agent_engines.create")
+    @patch("vertexai.agent_engines.AdkApp")
+    @patch("app.services.agent.build_agent")
+    @patch("vertexai.init")
     def test_wraps_agent_with_adkapp(
         self,
         mock_init: MagicMock,
@@ -132,10 +132,10 @@ class TestDeploy:
 
         mock_adkapp.assert_called_once_with(agent=mock_build.return_value)
 
-    @patch("deploy_agent.vertexai.agent_engines.create")
-    @patch("deploy_agent.AdkApp")
-    @patch("deploy_agent.build_agent")
-    @patch("deploy_agent.vertexai.init")
+    @patch("vertexai.agent_engines.create")
+    @patch("vertexai.agent_engines.AdkApp")
+    @patch("app.services.agent.build_agent")
+    @patch("vertexai.init")
     def test_create_called_with_requirements(
         self,
         mock_init: MagicMock,
@@ -158,10 +158,10 @@ class TestDeploy:
             extra_packages=["app"],
         )
 
-    @patch("deploy_agent.vertexai.agent_engines.create")
-    @patch("deploy_agent.AdkApp")
-    @patch("deploy_agent.build_agent")
-    @patch("deploy_agent.vertexai.init")
+    @patch("vertexai.agent_engines.create")
+    @patch("vertexai.agent_engines.AdkApp")
+    @patch("app.services.agent.build_agent")
+    @patch("vertexai.init")
     def test_requirements_include_aiplatform(
         self,
         mock_init: MagicMock,
@@ -174,10 +174,10 @@ class TestDeploy:
 
         assert any("google-cloud-aiplatform" in r for r in REQUIREMENTS)
 
-    @patch("deploy_agent.vertexai.agent_engines.create")
-    @patch("deploy_agent.AdkApp")
-    @patch("deploy_agent.build_agent")
-    @patch("deploy_agent.vertexai.init")
+    @patch("vertexai.agent_engines.create")
+    @patch("vertexai.agent_engines.AdkApp")
+    @patch("app.services.agent.build_agent")
+    @patch("vertexai.init")
     def test_requirements_include_firestore(
         self,
         mock_init: MagicMock,
@@ -199,10 +199,10 @@ class TestDeploy:
 class TestDeployUpdate:
     """Tests for deploy(update=True) — re-deploy after code changes."""
 
-    @patch("deploy_agent.vertexai.agent_engines.get")
-    @patch("deploy_agent.AdkApp")
-    @patch("deploy_agent.build_agent")
-    @patch("deploy_agent.vertexai.init")
+    @patch("vertexai.agent_engines.get")
+    @patch("vertexai.agent_engines.AdkApp")
+    @patch("app.services.agent.build_agent")
+    @patch("vertexai.init")
     def test_update_calls_agent_engines_get(
         self,
         mock_init: MagicMock,
@@ -217,10 +217,10 @@ class TestDeployUpdate:
 
         mock_get.assert_called_once()
 
-    @patch("deploy_agent.vertexai.agent_engines.get")
-    @patch("deploy_agent.AdkApp")
-    @patch("deploy_agent.build_agent")
-    @patch("deploy_agent.vertexai.init")
+    @patch("vertexai.agent_engines.get")
+    @patch("vertexai.agent_engines.AdkApp")
+    @patch("app.services.agent.build_agent")
+    @patch("vertexai.init")
     def test_update_calls_existing_update(
         self,
         mock_init: MagicMock,
@@ -240,11 +240,11 @@ class TestDeployUpdate:
             mock_adkapp.return_value, extra_packages=["app"]
         )
 
-    @patch("deploy_agent.vertexai.agent_engines.create")
-    @patch("deploy_agent.vertexai.agent_engines.get")
-    @patch("deploy_agent.AdkApp")
-    @patch("deploy_agent.build_agent")
-    @patch("deploy_agent.vertexai.init")
+    @patch("vertexai.agent_engines.create")
+    @patch("vertexai.agent_engines.get")
+    @patch("vertexai.agent_engines.AdkApp")
+    @patch("app.services.agent.build_agent")
+    @patch("vertexai.init")
     def test_update_does_not_call_create(
         self,
         mock_init: MagicMock,
@@ -1,13 +1,29 @@
 """Tests for JSON structured logging (TDD RED phase - written before implementation)."""
+import copy
 import json
 import logging
 
+import pytest
 
-def test_json_formatter_outputs_valid_json() -> None:
-    """JSONFormatter should produce valid JSON output."""
-    from app.core.logging import JSONFormatter
-    formatter = JSONFormatter()
-    record = logging.LogRecord(
+from app.core.logging import JSONFormatter, setup_logging
+
+
+@pytest.fixture(scope="module")
+def formatter() -> JSONFormatter:
+    """JSONFormatter is stateless, so one instance is shared across the module."""
+    return JSONFormatter()
+
+
+@pytest.fixture(scope="module")
+def logger() -> logging.Logger:
+    """Logger configured once via setup_logging("test-app")."""
+    return setup_logging("test-app")
+
+
+@pytest.fixture(scope="module")
+def base_record() -> logging.LogRecord:
+    """Baseline INFO record; tests copy it and override only what they need."""
+    return logging.LogRecord(
         name="test-service",
         level=logging.INFO,
         pathname="",
@@ -16,23 +32,38 @@ def test_json_formatter_outputs_valid_json() -> None:
         args=(),
         exc_info=None,
     )
-    output = formatter.format(record)
+
+
+def _derive(
+    base: logging.LogRecord, level: int | None = None, **attrs: object
+) -> logging.LogRecord:
+    """Return a shallow copy of base with the given attributes replaced."""
+    record = copy.copy(base)
+    if level is not None:
+        record.levelno = level
+        record.levelname = logging.getLevelName(level)
+    record.__dict__.update(attrs)
+    return record
+
+
+def test_json_formatter_outputs_valid_json(
+    formatter: JSONFormatter, base_record: logging.LogRecord
+) -> None:
+    """JSONFormatter should produce valid JSON output."""
+    output = formatter.format(_derive(base_record))
     parsed = json.loads(output)
     assert isinstance(parsed, dict)
 
 
-def test_json_formatter_has_required_fields() -> None:
+def test_json_formatter_has_required_fields(
+    formatter: JSONFormatter, base_record: logging.LogRecord
+) -> None:
     """Log output must contain timestamp, level, service, message fields."""
-    from app.core.logging import JSONFormatter
-    formatter = JSONFormatter()
-    record = logging.LogRecord(
-        name="my-service",
+    record = _derive(
+        base_record,
         level=logging.WARNING,
-        pathname="",
-        lineno=0,
+        name="my-service",
         msg="something happened",
-        args=(),
-        exc_info=None,
     )
     output = formatter.format(record)
     parsed = json.loads(output)
@@ -46,23 +77,20 @@ def test_json_formatter_has_required_fields() -> None:
     assert parsed["message"] == "something happened"
 
 
-def test_json_formatter_includes_error_type_on_exception() -> None:
+def test_json_formatter_includes_error_type_on_exception(
+    formatter: JSONFormatter, base_record: logging.LogRecord
+) -> None:
     """Log output should include error_type field when an exception is attached."""
-    from app.core.logging import JSONFormatter
-    formatter = JSONFormatter()
     try:
         raise ValueError("test error")
-    except ValueError:
-        import sys
-        exc_info = sys.exc_info()
+    except ValueError as e:
+        exc_info = (type(e), e, e.__traceback__)
 
-    record = logging.LogRecord(
-        name="error-service",
+    record = _derive(
+        base_record,
         level=logging.ERROR,
-        pathname="",
-        lineno=0,
+        name="error-service",
         msg="an error occurred",
-        args=(),
         exc_info=exc_info,
     )
     output = formatter.format(record)
@@ -72,9 +100,7 @@ def test_json_formatter_includes_error_type_on_exception() -> None:
     assert parsed["error_type"] == "ValueError"
 
 
-def test_setup_logging_returns_logger() -> None:
+def test_setup_logging_returns_logger(logger: logging.Logger) -> None:
     """setup_logging() should return a configured Logger instance."""
-    from app.core.logging import setup_logging
-    logger = setup_logging("test-app")
     assert isinstance(logger, logging.Logger)
     assert logger.name == "test-app"
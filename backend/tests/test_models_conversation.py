@@ -1,4 +1,7 @@
 """Tests for conversation data models (Task 2.1)."""
+import functools
+import types
+
 import pytest
 from pydantic import ValidationError
 
@@ -10,6 +13,49 @@ from app.models.conversation import (
     StructuredResponse,
 )
 
+_ALL_EMOTIONS = tuple(Emotion)
+_ALL_SCENES = tuple(Scene)
+
+_LONG_MSG = "a" * 2000
+_OVERFLOW_MSG = _LONG_MSG + "a"
+
+_RESPONSE_DEFAULTS = types.MappingProxyType(
+    {
+        "session_id": "session_001",
+        "dialogue": "こんにちは！",
+        "narration": "彼女は笑顔で挨拶した。",
+        "timestamp": "2026-02-23T10:00:00",
+    }
+)
+
+_STRUCTURED_DEFAULTS = types.MappingProxyType(
+    {
+        "dialogue": "今日はいい天気ですね！",
+        "narration": "彼女は窓の外を見た。",
+        "emotion": Emotion.happy,
+        "scene": Scene.indoor,
+        "affinity_level": 50,
+    }
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _default_conv_response() -> ConversationResponse:
+    """Validated default ConversationResponse shared by read-only tests."""
+    return ConversationResponse(**_RESPONSE_DEFAULTS)  # type: ignore[arg-type]
+
+
+@functools.lru_cache(maxsize=None)
+def _default_structured() -> StructuredResponse:
+    """Validated default StructuredResponse shared by read-only tests."""
+    return StructuredResponse(**_STRUCTURED_DEFAULTS)  # type: ignore[arg-type]
+
+
+@pytest.fixture(scope="module")
+def structured_schema() -> dict[str, object]:
+    """StructuredResponse JSON schema, generated once for the module."""
+    return StructuredResponse.model_json_schema()
+
 
 # ---------------------------------------------------------------------------
 # Enum Tests
@@ -87,29 +133,27 @@ class TestConversationRequest:
 
     def test_message_max_length(self) -> None:
         """Message must not exceed 2000 characters."""
-        long_message = "a" * 2001
-        with pytest.raises(ValidationError):
-            ConversationRequest(user_id="user_001", message=long_message)
+        with pytest.raises(ValidationError, match="string_too_long"):
+            ConversationRequest(user_id="user_001", message=_OVERFLOW_MSG)
 
     def test_message_max_length_boundary(self) -> None:
         """Message of exactly 2000 characters should be valid."""
-        boundary_message = "a" * 2000
-        req = ConversationRequest(user_id="user_001", message=boundary_message)
+        req = ConversationRequest(user_id="user_001", message=_LONG_MSG)
         assert len(req.message) == 2000
 
     def test_empty_message_rejected(self) -> None:
         """Empty message should be rejected."""
-        with pytest.raises(ValidationError):
+        with pytest.raises(ValidationError, match="string_too_short"):
             ConversationRequest(user_id="user_001", message="")
 
     def test_user_id_required(self) -> None:
         """user_id is required."""
-        with pytest.raises(ValidationError):
+        with pytest.raises(ValidationError, match="missing"):
             ConversationRequest(message="こんにちは")  # type: ignore[call-arg]
 
     def test_message_required(self) -> None:
         """message is required."""
-        with pytest.raises(ValidationError):
+        with pytest.raises(ValidationError, match="missing"):
             ConversationRequest(user_id="user_001")  # type: ignore[call-arg]
 
 
@@ -124,18 +168,11 @@ class TestConversationResponse:
 
     def _make_response(self, **kwargs: object) -> ConversationResponse:
         """Create a valid ConversationResponse with defaults."""
-        defaults: dict[str, object] = {
-            "session_id": "session_001",
-            "dialogue": "こんにちは！",
-            "narration": "彼女は笑顔で挨拶した。",
-            "timestamp": "2026-02-23T10:00:00",
-        }
-        defaults.update(kwargs)
-        return ConversationResponse(**defaults)  # type: ignore[arg-type]
+        return ConversationResponse(**{**_RESPONSE_DEFAULTS, **kwargs})  # type: ignore[arg-type]
 
     def test_valid_response(self) -> None:
         """Should create a valid response with required fields."""
-        resp = self._make_response()
+        resp = _default_conv_response()
         assert resp.session_id == "session_001"
         assert resp.dialogue == "こんにちは！"
         assert resp.narration == "彼女は笑顔で挨拶した。"
@@ -149,23 +186,20 @@ class TestConversationResponse:
 
     def test_required_fields(self) -> None:
         """All required fields must be present."""
-        with pytest.raises(ValidationError):
+        with pytest.raises(ValidationError, match="missing"):
             ConversationResponse(session_id="s1")  # type: ignore[call-arg]
 
     def test_no_emotion_field(self) -> None:
         """ConversationResponse must not expose emotion (backend-only concern)."""
-        resp = self._make_response()
-        assert not hasattr(resp, "emotion")
+        assert "emotion" not in ConversationResponse.model_fields
 
     def test_no_scene_field(self) -> None:
         """ConversationResponse must not expose scene (backend-only concern)."""
-        resp = self._make_response()
-        assert not hasattr(resp, "scene")
+        assert "scene" not in ConversationResponse.model_fields
 
     def test_no_affinity_level_field(self) -> None:
         """ConversationResponse must not expose affinity_level (backend-only concern)."""
-        resp = self._make_response()
-        assert not hasattr(resp, "affinity_level")
+        assert "affinity_level" not in ConversationResponse.model_fields
 
 
 # ---------------------------------------------------------------------------
@@ -182,19 +216,11 @@ class TestStructuredResponse:
 
     def _make_structured(self, **kwargs: object) -> StructuredResponse:
         """Create a valid StructuredResponse with defaults."""
-        defaults: dict[str, object] = {
-            "dialogue": "今日はいい天気ですね！",
-            "narration": "彼女は窓の外を見た。",
-            "emotion": Emotion.happy,
-            "scene": Scene.indoor,
-            "affinity_level": 50,
-        }
-        defaults.update(kwargs)
-        return StructuredResponse(**defaults)  # type: ignore[arg-type]
+        return StructuredResponse(**{**_STRUCTURED_DEFAULTS, **kwargs})  # type: ignore[arg-type]
 
     def test_valid_structured_response(self) -> None:
         """Should create a valid StructuredResponse."""
-        resp = self._make_structured()
+        resp = _default_structured()
         assert resp.dialogue == "今日はいい天気ですね！"
         assert resp.emotion == Emotion.happy
         assert resp.scene == Scene.indoor
@@ -212,39 +238,39 @@ class TestStructuredResponse:
 
     def test_affinity_level_below_min_rejected(self) -> None:
         """affinity_level below 0 should be rejected."""
-        with pytest.raises(ValidationError):
+        with pytest.raises(ValidationError, match="greater_than_equal"):
             self._make_structured(affinity_level=-1)
 
     def test_affinity_level_above_max_rejected(self) -> None:
         """affinity_level above 100 should be rejected."""
-        with pytest.raises(ValidationError):
+        with pytest.raises(ValidationError, match="less_than_equal"):
             self._make_structured(affinity_level=101)
 
-    def test_all_emotions_valid(self) -> None:
+    @pytest.mark.parametrize("emotion", _ALL_EMOTIONS)
+    def test_all_emotions_valid(self, emotion: Emotion) -> None:
         """All emotion values should be accepted."""
-        for emotion in Emotion:
-            resp = self._make_structured(emotion=emotion)
-            assert resp.emotion == emotion
+        resp = self._make_structured(emotion=emotion)
+        assert resp.emotion == emotion
 
-    def test_all_scenes_valid(self) -> None:
+    @pytest.mark.parametrize("scene", _ALL_SCENES)
+    def test_all_scenes_valid(self, scene: Scene) -> None:
         """All scene values should be accepted."""
-        for scene in Scene:
-            resp = self._make_structured(scene=scene)
-            assert resp.scene == scene
+        resp = self._make_structured(scene=scene)
+        assert resp.scene == scene
 
-    def test_json_schema_generation(self) -> None:
+    def test_json_schema_generation(self, structured_schema: dict) -> None:
         """Should be able to generate JSON schema (for ADK integration)."""
-        schema = StructuredResponse.model_json_schema()
-        assert "properties" in schema
-        assert "dialogue" in schema["properties"]
-        assert "affinity_level" in schema["properties"]
+        assert "properties" in structured_schema
+        properties = structured_schema["properties"]
+        assert "dialogue" in properties
+        assert "affinity_level" in properties
 
-    def test_json_schema_no_removed_fields(self) -> None:
+    def test_json_schema_no_removed_fields(self, structured_schema: dict) -> None:
         """Removed fields should not appear in JSON schema."""
-        schema = StructuredResponse.model_json_schema()
-        assert "affinityChange" not in schema["properties"]
-        assert "isImportantEvent" not in schema["properties"]
-        assert "eventSummary" not in schema["properties"]
-        assert "needsImageUpdate" not in schema["properties"]
+        properties = structured_schema["properties"]
+        assert "affinityChange" not in properties
+        assert "isImportantEvent" not in properties
+        assert "eventSummary" not in properties
+        assert "needsImageUpdate" not in properties
 
 
@@ -1,22 +1,37 @@
 """Tests for image generation data models (Task 2.2)."""
+import types
+
 import pytest
 from pydantic import ValidationError
 
 from app.models.conversation import Emotion, Scene
 from app.models.image import CharacterConfig, ImageGenerationRequest
 
+_ALL_EMOTIONS = tuple(Emotion)
+_ALL_SCENES = tuple(Scene)
+
+_REQUEST_DEFAULTS = types.MappingProxyType(
+    {
+        "emotion": Emotion.happy,
+        "scene": Scene.cafe,
+        "affinity_level": 50,
+    }
+)
+
+_CONFIG_DEFAULTS = types.MappingProxyType(
+    {
+        "name": "さくら",
+        "personality": "明るく元気な女の子",
+        "appearance_prompt": "anime style girl, long black hair, blue eyes, school uniform",
+    }
+)
+
 
 class TestImageGenerationRequest:
     """Tests for ImageGenerationRequest model."""
 
     def _make_request(self, **kwargs: object) -> ImageGenerationRequest:
-        defaults: dict[str, object] = {
-            "emotion": Emotion.happy,
-            "scene": Scene.cafe,
-            "affinity_level": 50,
-        }
-        defaults.update(kwargs)
-        return ImageGenerationRequest(**defaults)  # type: ignore[arg-type]
+        return ImageGenerationRequest(**{**_REQUEST_DEFAULTS, **kwargs})  # type: ignore[arg-type]
 
     def test_valid_request(self) -> None:
         """Should create a valid request."""
@@ -25,17 +40,17 @@ class TestImageGenerationRequest:
         assert req.scene == Scene.cafe
         assert req.affinity_level == 50
 
-    def test_all_emotions_accepted(self) -> None:
+    @pytest.mark.parametrize("emotion", _ALL_EMOTIONS)
+    def test_all_emotions_accepted(self, emotion: Emotion) -> None:
         """All Emotion enum values should be accepted."""
-        for emotion in Emotion:
-            req = self._make_request(emotion=emotion)
-            assert req.emotion == emotion
+        req = self._make_request(emotion=emotion)
+        assert req.emotion == emotion
 
-    def test_all_scenes_accepted(self) -> None:
+    @pytest.mark.parametrize("scene", _ALL_SCENES)
+    def test_all_scenes_accepted(self, scene: Scene) -> None:
         """All Scene enum values should be accepted."""
-        for scene in Scene:
-            req = self._make_request(scene=scene)
-            assert req.scene == scene
+        req = self._make_request(scene=scene)
+        assert req.scene == scene
 
     def test_affinity_level_min_boundary(self) -> None:
         """Affinity level of 0 should be valid."""
@@ -49,27 +64,27 @@ class TestImageGenerationRequest:
 
     def test_affinity_level_below_min_rejected(self) -> None:
         """Affinity level below 0 should be rejected."""
-        with pytest.raises(ValidationError):
+        with pytest.raises(ValidationError, match="greater_than_equal"):
             self._make_request(affinity_level=-1)
 
     def test_affinity_level_above_max_rejected(self) -> None:
         """Affinity level above 100 should be rejected."""
-        with pytest.raises(ValidationError):
+        with pytest.raises(ValidationError, match="less_than_equal"):
             self._make_request(affinity_level=101)
 
     def test_invalid_emotion_rejected(self) -> None:
         """Invalid emotion string should be rejected."""
-        with pytest.raises(ValidationError):
+        with pytest.raises(ValidationError, match="enum"):
             self._make_request(emotion="joyful")
 
     def test_invalid_scene_rejected(self) -> None:
         """Invalid scene string should be rejected."""
-        with pytest.raises(ValidationError):
+        with pytest.raises(ValidationError, match="enum"):
             self._make_request(scene="beach")
 
     def test_all_fields_required(self) -> None:
         """All fields are required."""
-        with pytest.raises(ValidationError):
+        with pytest.raises(ValidationError, match="missing"):
             ImageGenerationRequest(emotion=Emotion.happy, scene=Scene.cafe)  # type: ignore[call-arg]
 
 
@@ -77,13 +92,7 @@ class TestCharacterConfig:
     """Tests for CharacterConfig model."""
 
     def _make_config(self, **kwargs: object) -> CharacterConfig:
-        defaults: dict[str, object] = {
-            "name": "さくら",
-            "personality": "明るく元気な女の子",
-            "appearance_prompt": "anime style girl, long black hair, blue eyes, school uniform",
-        }
-        defaults.update(kwargs)
-        return CharacterConfig(**defaults)  # type: ignore[arg-type]
+        return CharacterConfig(**{**_CONFIG_DEFAULTS, **kwargs})  # type: ignore[arg-type]
 
     def test_valid_config(self) -> None:
         """Should create a valid character config."""
@@ -94,7 +103,7 @@ class TestCharacterConfig:
 
     def test_name_required(self) -> None:
         """name is required."""
-        with pytest.raises(ValidationError):
+        with pytest.raises(ValidationError, match="missing"):
             CharacterConfig(
                 personality="明るく元気な女の子",
                 appearance_prompt="anime style girl",
@@ -102,7 +111,7 @@ class TestCharacterConfig:
 
     def test_personality_required(self) -> None:
         """personality is required."""
-        with pytest.raises(ValidationError):
+        with pytest.raises(ValidationError, match="missing"):
             CharacterConfig(
                 name="さくら",
                 appearance_prompt="anime style girl",
@@ -110,7 +119,7 @@ class TestCharacterConfig:
 
     def test_appearance_prompt_required(self) -> None:
         """appearance_prompt is required."""
-        with pytest.raises(ValidationError):
+        with pytest.raises(ValidationError, match="missing"):
             CharacterConfig(
                 name="さくら",
                 personality="明るく元気な女の子",
@@ -1,11 +1,15 @@
 """Tests for ConversationRouter (Task 7.1, 7.2)."""
-from typing import Optional
-from unittest.mock import AsyncMock, MagicMock
+from typing import Callable, Optional
+from unittest.mock import MagicMock
 
+import httpx
 import pytest
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
-from app.models.conversation import ConversationResponse, Message
+from app.api.conversation import get_conversation_service, get_history, send_message
+from app.models.conversation import ConversationRequest, ConversationResponse, Message
+from app.services.conversation import ConversationService
 
 
 # ---------------------------------------------------------------------------
@@ -13,34 +17,42 @@ from app.models.conversation import ConversationResponse, Message
 # ---------------------------------------------------------------------------
 
 
-def _make_response(image_path: Optional[str] = None) -> ConversationResponse:
-    return ConversationResponse(
-        session_id="test-session-001",
-        dialogue="こんにちは！",
-        narration="彼女は微笑んだ。",
-        image_path=image_path,
-        timestamp="2026-02-24T00:00:00+00:00",
-    )
+_DEFAULT_RESPONSE = ConversationResponse(
+    session_id="test-session-001",
+    dialogue="こんにちは！",
+    narration="彼女は微笑んだ。",
+    image_path=None,
+    timestamp="2026-02-24T00:00:00+00:00",
+)
 
 
-@pytest.fixture
-def mock_service():
-    svc = MagicMock()
-    svc.send_message = AsyncMock(return_value=_make_response())
-    svc.get_history = MagicMock(return_value=[])
-    return svc
+def _response_with_image(image_path: str) -> ConversationResponse:
+    return _DEFAULT_RESPONSE.model_copy(update={"image_path": image_path})
 
 
-@pytest.fixture
-def client(mock_service):
-    from app.main import app
+@pytest.fixture(scope="module")
+def default_response(_app_client: TestClient, app: FastAPI) -> httpx.Response:
+    """A single successful POST /send shared by the read-only response checks.
 
-    app.state.conversation_service = mock_service
-    with TestClient(app) as c:
-        yield c
-    # cleanup
-    if hasattr(app.state, "conversation_service"):
-        del app.state.conversation_service
+    Uses its own mock rather than the session mock_service, so the result does
+    not depend on what earlier tests left configured on it.
+    """
+    service = MagicMock(spec=ConversationService)
+    service.send_message.return_value = _DEFAULT_RESPONSE
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setitem(app.dependency_overrides, get_conversation_service, lambda: service)
+        return _app_client.post(
+            "/api/conversation/send",
+            json={"user_id": "u1", "message": "hello"},
+        )
+
+
+@pytest.fixture(autouse=True)
+def _reset_mock(mock_service: MagicMock) -> None:
+    """Restore the session-scoped mock to its default behaviour before each test."""
+    mock_service.reset_mock(return_value=True, side_effect=True)
+    mock_service.send_message.return_value = _DEFAULT_RESPONSE
+    mock_service.get_history.return_value = []
 
 
 # ---------------------------------------------------------------------------
@@ -49,51 +61,29 @@ def client(mock_service):
 
 
 class TestSendMessageEndpoint:
-    def test_returns_200_on_success(self, client: TestClient) -> None:
-        resp = client.post(
-            "/api/conversation/send",
-            json={"user_id": "u1", "message": "hello"},
-        )
-        assert resp.status_code == 200
-
-    def test_response_has_session_id(self, client: TestClient) -> None:
-        resp = client.post(
-            "/api/conversation/send",
-            json={"user_id": "u1", "message": "hello"},
-        )
-        assert resp.json()["session_id"] == "test-session-001"
-
-    def test_response_has_dialogue(self, client: TestClient) -> None:
-        resp = client.post(
-            "/api/conversation/send",
-            json={"user_id": "u1", "message": "hello"},
-        )
-        assert resp.json()["dialogue"] == "こんにちは！"
-
-    def test_response_has_narration(self, client: TestClient) -> None:
-        resp = client.post(
-            "/api/conversation/send",
-            json={"user_id": "u1", "message": "hello"},
-        )
-        assert resp.json()["narration"] == "彼女は微笑んだ。"
+    def test_returns_200_on_success(self, default_response: httpx.Response) -> None:
+        assert default_response.status_code == 200
+
+    @pytest.mark.parametrize(
+        ("key", "expected"),
+        [
+            ("session_id", "test-session-001"),
+            ("dialogue", "こんにちは！"),
+            ("narration", "彼女は微笑んだ。"),
+            ("image_path", None),
+        ],
+    )
+    def test_response_field(
+        self, default_response: httpx.Response, key: str, expected: Optional[str]
+    ) -> None:
+        assert default_response.json()[key] == expected
 
-    def test_response_has_timestamp(self, client: TestClient) -> None:
-        resp = client.post(
-            "/api/conversation/send",
-            json={"user_id": "u1", "message": "hello"},
-        )
-        assert "timestamp" in resp.json()
-
-    def test_response_image_path_none_when_not_generated(self, client: TestClient) -> None:
-        resp = client.post(
-            "/api/conversation/send",
-            json={"user_id": "u1", "message": "hello"},
-        )
-        assert resp.json()["image_path"] is None
+    def test_response_has_timestamp(self, default_response: httpx.Response) -> None:
+        assert "timestamp" in default_response.json()
 
     def test_response_image_path_when_generated(self, client: TestClient, mock_service) -> None:
-        mock_service.send_message = AsyncMock(
-            return_value=_make_response(image_path="/data/images/happy_cafe.png")
+        mock_service.send_message.return_value = _response_with_image(
+            "/data/images/happy_cafe.png"
         )
         resp = client.post(
             "/api/conversation/send",
@@ -101,13 +91,10 @@ class TestSendMessageEndpoint:
         )
         assert resp.json()["image_path"] == "/data/images/happy_cafe.png"
 
-    def test_passes_request_body_to_service(self, client: TestClient, mock_service) -> None:
-        client.post(
-            "/api/conversation/send",
-            json={"user_id": "my-user", "message": "test msg", "session_id": "sess-1"},
-        )
-        call_args = mock_service.send_message.call_args
-        req = call_args.args[0]
+    async def test_passes_request_body_to_service(self, mock_service: MagicMock) -> None:
+        body = ConversationRequest(user_id="my-user", message="test msg", session_id="sess-1")
+        await send_message(body, service=mock_service)
+        req = mock_service.send_message.call_args.args[0]
         assert req.user_id == "my-user"
         assert req.message == "test msg"
         assert req.session_id == "sess-1"
@@ -126,24 +113,9 @@ class TestSendMessageEndpoint:
         )
         assert resp.status_code == 422
 
-    def test_returns_503_when_no_service(self) -> None:
-        """Should return 503 when ConversationService is not initialized."""
-        from app.main import app
-
-        # Ensure no service is set
-        if hasattr(app.state, "conversation_service"):
-            del app.state.conversation_service
-
-        with TestClient(app) as c:
-            resp = c.post(
-                "/api/conversation/send",
-                json={"user_id": "u1", "message": "hello"},
-            )
-        assert resp.status_code == 503
-
     def test_returns_503_on_service_error(self, client: TestClient, mock_service) -> None:
         """Should return 503 when service.send_message raises."""
-        mock_service.send_message = AsyncMock(side_effect=RuntimeError("Agent Engine error"))
+        mock_service.send_message.side_effect = RuntimeError("Agent Engine error")
         resp = client.post(
             "/api/conversation/send",
             json={"user_id": "u1", "message": "hello"},
@@ -166,40 +138,30 @@ class TestGetHistoryEndpoint:
         assert isinstance(resp.json(), list)
 
     def test_returns_messages_from_service(self, client: TestClient, mock_service) -> None:
-        mock_service.get_history = MagicMock(
-            return_value=[
-                Message(role="user", dialogue="hi", timestamp="2026-02-24T00:00:00Z"),
-                Message(role="agent", dialogue="hello", narration="nar", timestamp="2026-02-24T00:00:01Z"),
-            ]
-        )
+        mock_service.get_history.return_value = [
+            Message(role="user", dialogue="hi", timestamp="2026-02-24T00:00:00Z"),
+            Message(role="agent", dialogue="hello", narration="nar", timestamp="2026-02-24T00:00:01Z"),
+        ]
         resp = client.get("/api/conversation/history?session_id=sess-1")
         data = resp.json()
         assert len(data) == 2
         assert data[0]["role"] == "user"
         assert data[1]["role"] == "agent"
 
-    def test_passes_session_id_to_service(self, client: TestClient, mock_service) -> None:
-        client.get("/api/conversation/history?session_id=my-session")
-        mock_service.get_history.assert_called_once_with("my-session", 50)
+    async def test_passes_session_id_to_service(self, mock_service: MagicMock) -> None:
+        await get_history("my-session", service=mock_service)
+        assert mock_service.get_history.call_count == 1
+        assert mock_service.get_history.call_args.args == ("my-session", 50)
 
     def test_limit_param_passed_to_service(self, client: TestClient, mock_service) -> None:
         client.get("/api/conversation/history?session_id=sess-1&limit=10")
-        mock_service.get_history.assert_called_once_with("sess-1", 10)
+        assert mock_service.get_history.call_count == 1
+        assert mock_service.get_history.call_args.args == ("sess-1", 10)
 
     def test_returns_422_when_no_session_id(self, client: TestClient) -> None:
         resp = client.get("/api/conversation/history")
         assert resp.status_code == 422
 
-    def test_returns_503_when_no_service(self) -> None:
-        from app.main import app
-
-        if hasattr(app.state, "conversation_service"):
-            del app.state.conversation_service
-
-        with TestClient(app) as c:
-            resp = c.get("/api/conversation/history?session_id=sess-1")
-        assert resp.status_code == 503
-
 
 # ---------------------------------------------------------------------------
 # Task 7.2: Health check with service status
@@ -212,17 +174,56 @@ class TestHealthCheckWithService:
         assert "services" in resp.json()
 
     def test_health_agent_engine_ok_when_service_initialized(
-        self, client: TestClient
+        self,
+        client: TestClient,
+        app: FastAPI,
+        mock_service: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
+        # /health inspects app.state directly rather than the router dependency.
+        monkeypatch.setattr(app.state, "conversation_service", mock_service, raising=False)
         resp = client.get("/health")
         assert resp.json()["services"]["agent_engine"] == "ok"
 
-    def test_health_agent_engine_unavailable_when_no_service(self) -> None:
-        from app.main import app
 
-        if hasattr(app.state, "conversation_service"):
-            del app.state.conversation_service
+# ---------------------------------------------------------------------------
+# Service not initialized (Agent Engine unavailable)
+# ---------------------------------------------------------------------------
+
 
-        with TestClient(app) as c:
-            resp = c.get("/health")
-        assert resp.json()["services"]["agent_engine"] == "unavailable"
+@pytest.mark.parametrize(
+    ("method", "path", "body", "check"),
+    [
+        pytest.param(
+            "POST",
+            "/api/conversation/send",
+            {"user_id": "u1", "message": "hello"},
+            lambda r: r.status_code == 503,
+            id="send_returns_503",
+        ),
+        pytest.param(
+            "GET",
+            "/api/conversation/history?session_id=sess-1",
+            None,
+            lambda r: r.status_code == 503,
+            id="history_returns_503",
+        ),
+        pytest.param(
+            "GET",
+            "/health",
+            None,
+            lambda r: r.json()["services"]["agent_engine"] == "unavailable",
+            id="health_reports_unavailable",
+        ),
+    ],
+)
+def test_no_service_behavior(
+    bare_client: TestClient,
+    method: str,
+    path: str,
+    body: Optional[dict],
+    check: Callable[[httpx.Response], bool],
+) -> None:
+    """Endpoints should degrade gracefully when ConversationService is not initialized."""
+    resp = bare_client.request(method, path, json=body)
+    assert check(resp)
@@ -1,11 +1,19 @@
 """Tests for ConversationService (Task 6.1, 6.2)."""
-from typing import Any, Optional
-from unittest.mock import AsyncMock, MagicMock
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
+from unittest.mock import MagicMock
 
 import pytest
 
-from app.models.conversation import ConversationRequest, Emotion, Scene, StructuredResponse
-from app.models.image import CharacterConfig, ImageGenerationRequest
+from app.models.conversation import (
+    ConversationRequest,
+    ConversationResponse,
+    Emotion,
+    Scene,
+    StructuredResponse,
+)
+from app.models.image import ImageGenerationRequest
+from app.services.conversation import ConversationService
 
 
 # ---------------------------------------------------------------------------
@@ -13,15 +21,6 @@ from app.models.image import CharacterConfig, ImageGenerationRequest
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture
-def character_config() -> CharacterConfig:
-    return CharacterConfig(
-        name="あかり",
-        personality="明るく元気な女の子",
-        appearance_prompt="anime style girl, long black hair, blue eyes",
-    )
-
-
 def _make_structured(
     emotion: Emotion = Emotion.neutral,
     scene: Scene = Scene.indoor,
@@ -36,153 +35,172 @@ def _make_structured(
     )
 
 
-def _make_chat_agent_mock(
-    structured: Optional[StructuredResponse] = None,
-    session_id: str = "session-abc",
-) -> MagicMock:
-    if structured is None:
-        structured = _make_structured()
-    mock = MagicMock()
-    mock.run = AsyncMock(return_value=(structured, session_id))
-    return mock
+# Shared read-only inputs; the service never mutates requests, responses or prev context,
+# so no state leaks between tests regardless of order or xdist worker.
+_DEFAULT_STRUCTURED = _make_structured()
+_DEFAULT_REQUEST = ConversationRequest(user_id="u", message="m")
+_PREV_NEUTRAL: Mapping[str, Any] = MappingProxyType(
+    {"emotion": "neutral", "scene": "indoor", "affinity_level": 0}
+)
+_PRESETS: Mapping[str, StructuredResponse] = MappingProxyType({
+    "happy_indoor_0": _make_structured(emotion=Emotion.happy),
+    "happy_cafe_0": _make_structured(emotion=Emotion.happy, scene=Scene.cafe),
+    "happy_park_30": _make_structured(emotion=Emotion.happy, scene=Scene.park, affinity_level=30),
+    "sad_park_55": _make_structured(emotion=Emotion.sad, scene=Scene.park, affinity_level=55),
+})
 
 
-def _make_image_service_mock(image_path: Optional[str] = "/data/images/test.png") -> MagicMock:
-    mock = MagicMock()
-    mock.generate_image = MagicMock(return_value=image_path)
-    return mock
+class _StubChatAgent:
+    """ChatAgent stand-in that records run() kwargs and replays canned turns.
 
+    Each call returns the next of `turns`; the last one repeats once they run out.
+    """
 
-# ---------------------------------------------------------------------------
-# Task 6.1: Construction
-# ---------------------------------------------------------------------------
+    def __init__(
+        self,
+        structured: Optional[StructuredResponse] = None,
+        session_id: str = "session-abc",
+        turns: Optional[list[tuple[StructuredResponse, str]]] = None,
+    ) -> None:
+        self._turns = turns or [(structured or _DEFAULT_STRUCTURED, session_id)]
+        self.calls: list[dict[str, Any]] = []
 
+    async def run(self, **kwargs: Any) -> tuple[StructuredResponse, str]:
+        self.calls.append(kwargs)
+        return self._turns[min(len(self.calls), len(self._turns)) - 1]
 
-class TestConversationServiceConstruction:
-    def test_stores_chat_agent(self) -> None:
-        from app.services.conversation import ConversationService
 
-        agent = _make_chat_agent_mock()
-        image = _make_image_service_mock()
-        svc = ConversationService(chat_agent=agent, image_service=image)
-        assert svc.chat_agent is agent
+class _StubImageService:
+    """ImageGenerationService stand-in that records requests and returns a fixed path."""
 
-    def test_stores_image_service(self) -> None:
-        from app.services.conversation import ConversationService
+    def __init__(self, image_path: Optional[str] = "/data/images/test.png") -> None:
+        self.image_path = image_path
+        self.calls: list[ImageGenerationRequest] = []
 
-        svc = ConversationService(chat_agent=_make_chat_agent_mock(), image_service=_make_image_service_mock())
-        assert svc.image_service is not None
+    def generate_image(self, request: ImageGenerationRequest) -> Optional[str]:
+        self.calls.append(request)
+        return self.image_path
 
-    def test_session_context_initially_empty(self) -> None:
-        from app.services.conversation import ConversationService
 
-        svc = ConversationService(chat_agent=_make_chat_agent_mock(), image_service=_make_image_service_mock())
-        assert svc._session_context == {}
+class _NullImageService(_StubImageService):
+    """Image service that never generates or records; safe to share across tests."""
 
+    def __init__(self) -> None:
+        super().__init__(image_path=None)
 
-# ---------------------------------------------------------------------------
-# Task 6.1: send_message — agent call and context passing
-# ---------------------------------------------------------------------------
+    def generate_image(self, request: ImageGenerationRequest) -> Optional[str]:
+        return None
 
 
-class TestSendMessageOrchestration:
-    async def test_calls_chat_agent_run(self) -> None:
-        from app.services.conversation import ConversationService
+# Shared by every test that leaves image_path=None and never inspects image calls.
+_NULL_IMAGE_SERVICE = _NullImageService()
 
-        mock_agent = _make_chat_agent_mock()
-        svc = ConversationService(chat_agent=mock_agent, image_service=_make_image_service_mock(None))
-        await svc.send_message(ConversationRequest(user_id="u", message="hello"))
-        mock_agent.run.assert_called_once()
 
-    async def test_passes_user_id_to_agent(self) -> None:
-        from app.services.conversation import ConversationService
+def _build_service(
+    structured: Optional[StructuredResponse] = None,
+    session_id: str = "session-abc",
+    image_path: Optional[str] = None,
+    turns: Optional[list[tuple[StructuredResponse, str]]] = None,
+) -> ConversationService:
+    """ConversationService wired to a fresh agent stub and an image service stub.
+
+    The stubs stay reachable as svc.chat_agent and svc.image_service. With
+    image_path=None the shared _NULL_IMAGE_SERVICE is used instead of a new stub.
+    """
+    image_service = (
+        _NULL_IMAGE_SERVICE if image_path is None else _StubImageService(image_path=image_path)
+    )
+    return ConversationService(
+        chat_agent=_StubChatAgent(  # type: ignore[arg-type]
+            structured=structured, session_id=session_id, turns=turns
+        ),
+        image_service=image_service,  # type: ignore[arg-type]
+    )
 
-        mock_agent = _make_chat_agent_mock()
-        svc = ConversationService(chat_agent=mock_agent, image_service=_make_image_service_mock(None))
-        await svc.send_message(ConversationRequest(user_id="my-user", message="hi"))
-        assert mock_agent.run.call_args.kwargs.get("user_id") == "my-user"
 
-    async def test_passes_message_to_agent(self) -> None:
-        from app.services.conversation import ConversationService
+@pytest.fixture(autouse=True)
+def _no_firestore(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Replace the Firestore client so construction needs no GCP credentials."""
+    monkeypatch.setattr("app.services.conversation.firestore.Client", MagicMock)
 
-        mock_agent = _make_chat_agent_mock()
-        svc = ConversationService(chat_agent=mock_agent, image_service=_make_image_service_mock(None))
-        await svc.send_message(ConversationRequest(user_id="u", message="test message"))
-        assert mock_agent.run.call_args.kwargs.get("message") == "test message"
 
-    async def test_passes_session_id_to_agent(self) -> None:
-        from app.services.conversation import ConversationService
+# ---------------------------------------------------------------------------
+# Task 6.1: Construction
+# ---------------------------------------------------------------------------
 
-        mock_agent = _make_chat_agent_mock()
-        svc = ConversationService(chat_agent=mock_agent, image_service=_make_image_service_mock(None))
-        await svc.send_message(ConversationRequest(user_id="u", message="m", session_id="sid-123"))
-        assert mock_agent.run.call_args.kwargs.get("session_id") == "sid-123"
 
-    async def test_first_turn_passes_default_scene(self) -> None:
-        from app.services.conversation import ConversationService
+class TestConversationServiceConstruction:
+    def test_construction_invariants(self) -> None:
+        """Constructor stores both collaborators and starts with no session context."""
+        agent = _StubChatAgent()
+        image = _StubImageService()
+        svc = ConversationService(chat_agent=agent, image_service=image)  # type: ignore[arg-type]
+        assert svc.chat_agent is agent
+        assert svc.image_service is image
+        assert svc._session_context == {}
 
-        mock_agent = _make_chat_agent_mock()
-        svc = ConversationService(chat_agent=mock_agent, image_service=_make_image_service_mock(None))
-        await svc.send_message(ConversationRequest(user_id="u", message="m"))
-        assert mock_agent.run.call_args.kwargs.get("scene") == "indoor"
 
-    async def test_first_turn_passes_default_emotion(self) -> None:
-        from app.services.conversation import ConversationService
+# ---------------------------------------------------------------------------
+# Task 6.1: send_message — agent call and context passing
+# ---------------------------------------------------------------------------
 
-        mock_agent = _make_chat_agent_mock()
-        svc = ConversationService(chat_agent=mock_agent, image_service=_make_image_service_mock(None))
-        await svc.send_message(ConversationRequest(user_id="u", message="m"))
-        assert mock_agent.run.call_args.kwargs.get("emotion") == "neutral"
 
-    async def test_second_turn_passes_previous_scene(self) -> None:
-        from app.services.conversation import ConversationService
+@pytest.mark.asyncio(loop_scope="module")
+class TestSendMessageOrchestration:
+    async def test_calls_chat_agent_run(self) -> None:
+        svc = _build_service()
+        await svc.send_message(ConversationRequest(user_id="u", message="hello"))
+        assert len(svc.chat_agent.calls) == 1
+
+    @pytest.mark.parametrize(
+        ("field", "expected"),
+        [
+            ("user_id", "my-user"),
+            ("message", "test message"),
+            ("session_id", "sid-123"),
+            ("scene", "indoor"),
+            ("emotion", "neutral"),
+            ("affinity_level", 0),
+        ],
+    )
+    async def test_first_turn_run_kwargs(self, field: str, expected: object) -> None:
+        """First turn forwards the request fields and the default context to run()."""
+        svc = _build_service()
+        await svc.send_message(
+            ConversationRequest(user_id="my-user", message="test message", session_id="sid-123")
+        )
+        (kwargs,) = svc.chat_agent.calls
+        assert kwargs[field] == expected
 
-        first = _make_structured(scene=Scene.cafe, emotion=Emotion.happy)
-        mock_agent = _make_chat_agent_mock(structured=first)
-        svc = ConversationService(chat_agent=mock_agent, image_service=_make_image_service_mock(None))
+    async def test_second_turn_passes_previous_scene(self) -> None:
+        first = _PRESETS["happy_cafe_0"]
+        svc = _build_service(turns=[(first, "s1"), (_DEFAULT_STRUCTURED, "s2")])
         await svc.send_message(ConversationRequest(user_id="u", message="first"))
-
-        mock_agent.run = AsyncMock(return_value=(_make_structured(), "s"))
         await svc.send_message(ConversationRequest(user_id="u", message="second"))
-        assert mock_agent.run.call_args.kwargs.get("scene") == "cafe"
+        assert svc.chat_agent.calls[-1]["scene"] == "cafe"
 
     async def test_second_turn_passes_previous_emotion(self) -> None:
-        from app.services.conversation import ConversationService
-
-        first = _make_structured(emotion=Emotion.happy, scene=Scene.cafe)
-        mock_agent = _make_chat_agent_mock(structured=first)
-        svc = ConversationService(chat_agent=mock_agent, image_service=_make_image_service_mock(None))
+        first = _PRESETS["happy_cafe_0"]
+        svc = _build_service(turns=[(first, "s1"), (_DEFAULT_STRUCTURED, "s2")])
         await svc.send_message(ConversationRequest(user_id="u", message="first"))
-
-        mock_agent.run = AsyncMock(return_value=(_make_structured(), "s"))
         await svc.send_message(ConversationRequest(user_id="u", message="second"))
-        assert mock_agent.run.call_args.kwargs.get("emotion") == "happy"
+        assert svc.chat_agent.calls[-1]["emotion"] == "happy"
 
     async def test_response_fields(self) -> None:
-        from app.services.conversation import ConversationService
-
         structured = StructuredResponse(
             dialogue="やあ！", narration="彼女は笑った。",
             emotion=Emotion.happy, scene=Scene.cafe, affinity_level=10,
         )
-        svc = ConversationService(
-            chat_agent=_make_chat_agent_mock(structured=structured, session_id="s-99"),
-            image_service=_make_image_service_mock(None),
-        )
-        resp = await svc.send_message(ConversationRequest(user_id="u", message="m"))
+        svc = _build_service(structured=structured, session_id="s-99")
+        resp = await svc.send_message(_DEFAULT_REQUEST)
         assert resp.session_id == "s-99"
         assert resp.dialogue == "やあ！"
         assert resp.narration == "彼女は笑った。"
         assert resp.timestamp
 
     async def test_context_updated_after_turn(self) -> None:
-        from app.services.conversation import ConversationService
-
-        structured = _make_structured(emotion=Emotion.happy, scene=Scene.park, affinity_level=30)
-        svc = ConversationService(
-            chat_agent=_make_chat_agent_mock(structured=structured),
-            image_service=_make_image_service_mock(None),
-        )
+        structured = _PRESETS["happy_park_30"]
+        svc = _build_service(structured=structured)
         await svc.send_message(ConversationRequest(user_id="user1", message="m"))
         ctx = svc._session_context["user1"]
         assert ctx["emotion"] == "happy"
@@ -191,12 +209,7 @@ class TestSendMessageOrchestration:
 
     async def test_history_stored_after_turn(self) -> None:
         """User and agent messages should be stored in history after send_message."""
-        from app.services.conversation import ConversationService
-
-        svc = ConversationService(
-            chat_agent=_make_chat_agent_mock(session_id="sess-x"),
-            image_service=_make_image_service_mock(None),
-        )
+        svc = _build_service(session_id="sess-x")
         await svc.send_message(ConversationRequest(user_id="u", message="hello"))
 
         history = svc.get_history("sess-x")
@@ -207,12 +220,7 @@ class TestSendMessageOrchestration:
 
     async def test_history_accumulates_across_turns(self) -> None:
         """History should grow with each turn."""
-        from app.services.conversation import ConversationService
-
-        mock_agent = _make_chat_agent_mock(session_id="sess-y")
-        svc = ConversationService(
-            chat_agent=mock_agent, image_service=_make_image_service_mock(None)
-        )
+        svc = _build_service(session_id="sess-y")
         await svc.send_message(ConversationRequest(user_id="u", message="turn1", session_id="sess-y"))
         await svc.send_message(ConversationRequest(user_id="u", message="turn2", session_id="sess-y"))
 
@@ -221,12 +229,7 @@ class TestSendMessageOrchestration:
 
     async def test_get_history_respects_limit(self) -> None:
         """get_history should return at most `limit` messages."""
-        from app.services.conversation import ConversationService
-
-        mock_agent = _make_chat_agent_mock(session_id="sess-z")
-        svc = ConversationService(
-            chat_agent=mock_agent, image_service=_make_image_service_mock(None)
-        )
+        svc = _build_service(session_id="sess-z")
         for _ in range(3):
             await svc.send_message(ConversationRequest(user_id="u", message="m", session_id="sess-z"))
 
@@ -234,11 +237,7 @@ class TestSendMessageOrchestration:
         assert len(history) == 2
 
     async def test_get_history_empty_for_unknown_session(self) -> None:
-        from app.services.conversation import ConversationService
-
-        svc = ConversationService(
-            chat_agent=_make_chat_agent_mock(), image_service=_make_image_service_mock(None)
-        )
+        svc = _build_service()
         assert svc.get_history("unknown-session") == []
 
 
@@ -247,165 +246,99 @@ class TestSendMessageOrchestration:
 # ---------------------------------------------------------------------------
 
 
+@pytest.mark.asyncio(loop_scope="module")
 class TestImageGenerationTrigger:
     """Trigger = emotion CATEGORY change OR scene change OR affinity >= 10."""
 
     async def _run(
         self,
         structured: StructuredResponse,
-        prev: Optional[dict[str, Any]] = None,
+        prev: Optional[Mapping[str, Any]] = None,
         image_path: Optional[str] = "/img/test.png",
-    ) -> tuple[object, MagicMock]:
-        from app.services.conversation import ConversationService
-
-        mock_agent = _make_chat_agent_mock(structured=structured)
-        mock_image = _make_image_service_mock(image_path=image_path)
-        svc = ConversationService(chat_agent=mock_agent, image_service=mock_image)
+    ) -> tuple[ConversationResponse, _StubImageService]:
+        svc = _build_service(structured=structured, image_path=image_path)
         if prev:
-            svc._session_context["u"] = prev
-        resp = await svc.send_message(ConversationRequest(user_id="u", message="m"))
-        return resp, mock_image
-
-    # --- Emotion category change triggers ---
-
-    async def test_generates_when_emotion_category_changes(self) -> None:
-        """neutral(neutral) → happy(positive): category change → generate."""
-        structured = _make_structured(emotion=Emotion.happy, scene=Scene.indoor, affinity_level=0)
-        _, mock_image = await self._run(
-            structured, prev={"emotion": "neutral", "scene": "indoor", "affinity_level": 0}
-        )
-        mock_image.generate_image.assert_called_once()
-
-    async def test_generates_when_positive_to_negative(self) -> None:
-        """happy(positive) → sad(negative): category change → generate."""
-        structured = _make_structured(emotion=Emotion.sad, scene=Scene.indoor, affinity_level=0)
-        _, mock_image = await self._run(
-            structured, prev={"emotion": "happy", "scene": "indoor", "affinity_level": 0}
-        )
-        mock_image.generate_image.assert_called_once()
-
-    async def test_generates_when_neutral_to_expressive(self) -> None:
-        """neutral → surprised(expressive): category change → generate."""
-        structured = _make_structured(emotion=Emotion.surprised, scene=Scene.indoor, affinity_level=0)
-        _, mock_image = await self._run(
-            structured, prev={"emotion": "neutral", "scene": "indoor", "affinity_level": 0}
-        )
-        mock_image.generate_image.assert_called_once()
-
-    # --- Same emotion category does NOT trigger ---
-
-    async def test_no_image_when_same_positive_category(self) -> None:
-        """happy → excited: both positive → no generate."""
-        structured = _make_structured(emotion=Emotion.excited, scene=Scene.indoor, affinity_level=0)
-        _, mock_image = await self._run(
-            structured, prev={"emotion": "happy", "scene": "indoor", "affinity_level": 0}
-        )
-        mock_image.generate_image.assert_not_called()
-
-    async def test_no_image_when_same_neutral_category(self) -> None:
-        """neutral → thoughtful: both neutral → no generate."""
-        structured = _make_structured(emotion=Emotion.thoughtful, scene=Scene.indoor, affinity_level=0)
-        _, mock_image = await self._run(
-            structured, prev={"emotion": "neutral", "scene": "indoor", "affinity_level": 0}
-        )
-        mock_image.generate_image.assert_not_called()
-
-    async def test_no_image_when_same_expressive_category(self) -> None:
-        """surprised → embarrassed: both expressive → no generate."""
-        structured = _make_structured(emotion=Emotion.embarrassed, scene=Scene.indoor, affinity_level=0)
-        _, mock_image = await self._run(
-            structured, prev={"emotion": "surprised", "scene": "indoor", "affinity_level": 0}
-        )
-        mock_image.generate_image.assert_not_called()
-
-    # --- Scene change triggers ---
-
-    async def test_generates_when_scene_changes(self) -> None:
-        structured = _make_structured(emotion=Emotion.neutral, scene=Scene.cafe, affinity_level=0)
-        _, mock_image = await self._run(
-            structured, prev={"emotion": "neutral", "scene": "indoor", "affinity_level": 0}
-        )
-        mock_image.generate_image.assert_called_once()
-
-    # --- Affinity threshold triggers ---
-
-    async def test_generates_when_affinity_exceeds_threshold(self) -> None:
-        structured = _make_structured(emotion=Emotion.neutral, scene=Scene.indoor, affinity_level=10)
-        _, mock_image = await self._run(
-            structured, prev={"emotion": "neutral", "scene": "indoor", "affinity_level": 0}
-        )
-        mock_image.generate_image.assert_called_once()
-
-    async def test_generates_when_affinity_decreases_by_threshold(self) -> None:
-        structured = _make_structured(emotion=Emotion.neutral, scene=Scene.indoor, affinity_level=0)
-        _, mock_image = await self._run(
-            structured, prev={"emotion": "neutral", "scene": "indoor", "affinity_level": 10}
-        )
-        mock_image.generate_image.assert_called_once()
-
-    async def test_no_image_when_nothing_changes(self) -> None:
-        structured = _make_structured(emotion=Emotion.neutral, scene=Scene.indoor, affinity_level=5)
-        _, mock_image = await self._run(
-            structured, prev={"emotion": "neutral", "scene": "indoor", "affinity_level": 0}
-        )
-        mock_image.generate_image.assert_not_called()
-
-    async def test_no_image_when_affinity_change_below_threshold(self) -> None:
-        structured = _make_structured(emotion=Emotion.neutral, scene=Scene.indoor, affinity_level=9)
-        _, mock_image = await self._run(
-            structured, prev={"emotion": "neutral", "scene": "indoor", "affinity_level": 0}
-        )
-        mock_image.generate_image.assert_not_called()
+            svc._session_context["u"] = prev  # type: ignore[assignment]
+        resp = await svc.send_message(_DEFAULT_REQUEST)
+        return resp, svc.image_service
+
+    @pytest.mark.parametrize(
+        ("structured", "prev", "should_generate"),
+        [
+            # --- Emotion category change triggers ---
+            (_PRESETS["happy_indoor_0"], _PREV_NEUTRAL, True),
+            (_make_structured(emotion=Emotion.sad), {**_PREV_NEUTRAL, "emotion": "happy"}, True),
+            (_make_structured(emotion=Emotion.surprised), _PREV_NEUTRAL, True),
+            # --- Same emotion category does NOT trigger ---
+            (_make_structured(emotion=Emotion.excited), {**_PREV_NEUTRAL, "emotion": "happy"}, False),
+            (_make_structured(emotion=Emotion.thoughtful), _PREV_NEUTRAL, False),
+            (_make_structured(emotion=Emotion.embarrassed), {**_PREV_NEUTRAL, "emotion": "surprised"}, False),
+            # --- Scene change triggers ---
+            (_make_structured(scene=Scene.cafe), _PREV_NEUTRAL, True),
+            # --- Affinity threshold triggers ---
+            (_make_structured(affinity_level=10), _PREV_NEUTRAL, True),
+            (_DEFAULT_STRUCTURED, {**_PREV_NEUTRAL, "affinity_level": 10}, True),
+            (_make_structured(affinity_level=5), _PREV_NEUTRAL, False),
+            (_make_structured(affinity_level=9), _PREV_NEUTRAL, False),
+        ],
+        ids=[
+            "neutral_to_positive",
+            "positive_to_negative",
+            "neutral_to_expressive",
+            "same_positive_category",
+            "same_neutral_category",
+            "same_expressive_category",
+            "scene_changes",
+            "affinity_up_by_exact_threshold",
+            "affinity_down_by_threshold",
+            "nothing_changes",
+            "affinity_change_below_threshold",
+        ],
+    )
+    async def test_trigger(
+        self, structured: StructuredResponse, prev: Mapping[str, Any], should_generate: bool
+    ) -> None:
+        """Image is generated (and its path returned) only when the trigger fires."""
+        resp, image_service = await self._run(structured, prev=prev)
 
-    async def test_exact_threshold_10_triggers(self) -> None:
-        structured = _make_structured(emotion=Emotion.neutral, scene=Scene.indoor, affinity_level=10)
-        _, mock_image = await self._run(
-            structured, prev={"emotion": "neutral", "scene": "indoor", "affinity_level": 0}
-        )
-        mock_image.generate_image.assert_called_once()
+        assert bool(image_service.calls) is should_generate
+        assert resp.image_path == ("/img/test.png" if should_generate else None)
 
     async def test_returns_image_path_when_generated(self) -> None:
-        from app.models.conversation import ConversationResponse
-
-        structured = _make_structured(emotion=Emotion.happy)
+        structured = _PRESETS["happy_indoor_0"]
         resp, _ = await self._run(
             structured,
-            prev={"emotion": "neutral", "scene": "indoor", "affinity_level": 0},
+            prev=_PREV_NEUTRAL,
             image_path="/data/happy_cafe.png",
         )
         assert isinstance(resp, ConversationResponse)
         assert resp.image_path == "/data/happy_cafe.png"
 
     async def test_image_path_none_when_not_triggered(self) -> None:
-        from app.models.conversation import ConversationResponse
-
-        structured = _make_structured()
         resp, _ = await self._run(
-            structured,
-            prev={"emotion": "neutral", "scene": "indoor", "affinity_level": 0},
+            _DEFAULT_STRUCTURED,
+            prev=_PREV_NEUTRAL,
             image_path=None,
         )
         assert isinstance(resp, ConversationResponse)
         assert resp.image_path is None
 
     async def test_fallback_none_on_generation_failure(self) -> None:
-        from app.models.conversation import ConversationResponse
-
-        structured = _make_structured(emotion=Emotion.happy)
+        structured = _PRESETS["happy_indoor_0"]
         resp, _ = await self._run(
             structured,
-            prev={"emotion": "neutral", "scene": "indoor", "affinity_level": 0},
+            prev=_PREV_NEUTRAL,
             image_path=None,
         )
         assert isinstance(resp, ConversationResponse)
         assert resp.image_path is None
 
     async def test_passes_correct_params_to_image_service(self) -> None:
-        structured = _make_structured(emotion=Emotion.sad, scene=Scene.park, affinity_level=55)
-        _, mock_image = await self._run(
-            structured, prev={"emotion": "neutral", "scene": "indoor", "affinity_level": 0}
+        structured = _PRESETS["sad_park_55"]
+        _, image_service = await self._run(
+            structured, prev=_PREV_NEUTRAL
         )
-        req: ImageGenerationRequest = mock_image.generate_image.call_args.args[0]
+        (req,) = image_service.calls
         assert req.emotion == Emotion.sad
         assert req.scene == Scene.park
         assert req.affinity_level == 55
@@ -1,4 +1,7 @@
 """Tests for ImageGenerationService prompt building (Task 5.1)."""
+import functools
+from typing import Callable
+
 import pytest
 
 from app.models.conversation import Emotion, Scene
@@ -11,74 +14,77 @@ CHARACTER_CONFIG = CharacterConfig(
     appearance_prompt="anime style girl, long black hair, blue eyes, school uniform",
 )
 
+_PromptFor = Callable[[Emotion, Scene, int], str]
+
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def service() -> ImageGenerationService:
+    """Service built once; build_prompt() is pure, so tests can share it."""
     return ImageGenerationService(character_config=CHARACTER_CONFIG)
 
 
+@pytest.fixture(scope="module")
+def prompt_for(service: ImageGenerationService) -> _PromptFor:
+    """build_prompt() memoized per (emotion, scene, affinity_level) for this module."""
+
+    @functools.lru_cache(maxsize=None)
+    def _prompt(emotion: Emotion, scene: Scene, affinity_level: int) -> str:
+        req = ImageGenerationRequest(emotion=emotion, scene=scene, affinity_level=affinity_level)
+        return service.build_prompt(req)
+
+    return _prompt
+
+
 class TestBuildPrompt:
     """Tests for ImageGenerationService.build_prompt()."""
 
-    def test_prompt_contains_appearance(self, service: ImageGenerationService) -> None:
+    def test_prompt_contains_appearance(self, prompt_for: _PromptFor) -> None:
         """Prompt must contain character appearance_prompt."""
-        req = ImageGenerationRequest(emotion=Emotion.happy, scene=Scene.cafe, affinity_level=50)
-        prompt = service.build_prompt(req)
+        prompt = prompt_for(Emotion.happy, Scene.cafe, 50)
         assert CHARACTER_CONFIG.appearance_prompt in prompt
 
-    def test_prompt_contains_emotion(self, service: ImageGenerationService) -> None:
+    def test_prompt_contains_emotion(self, prompt_for: _PromptFor) -> None:
         """Prompt must contain emotion description."""
-        req = ImageGenerationRequest(emotion=Emotion.embarrassed, scene=Scene.cafe, affinity_level=50)
-        prompt = service.build_prompt(req)
+        prompt = prompt_for(Emotion.embarrassed, Scene.cafe, 50)
         assert "embarrassed" in prompt or "blushing" in prompt
 
-    def test_prompt_contains_scene(self, service: ImageGenerationService) -> None:
+    def test_prompt_contains_scene(self, prompt_for: _PromptFor) -> None:
         """Prompt must contain scene description."""
-        req = ImageGenerationRequest(emotion=Emotion.happy, scene=Scene.park, affinity_level=50)
-        prompt = service.build_prompt(req)
+        prompt = prompt_for(Emotion.happy, Scene.park, 50)
         assert "park" in prompt
 
-    def test_all_emotions_have_mapping(self, service: ImageGenerationService) -> None:
+    @pytest.mark.parametrize("emotion", list(Emotion))
+    def test_all_emotions_have_mapping(self, prompt_for: _PromptFor, emotion: Emotion) -> None:
         """Every Emotion value must produce a non-empty prompt."""
-        for emotion in Emotion:
-            req = ImageGenerationRequest(emotion=emotion, scene=Scene.indoor, affinity_level=50)
-            prompt = service.build_prompt(req)
-            assert len(prompt) > 0
+        prompt = prompt_for(emotion, Scene.indoor, 50)
+        assert len(prompt) > 0
 
-    def test_all_scenes_have_mapping(self, service: ImageGenerationService) -> None:
+    @pytest.mark.parametrize("scene", list(Scene))
+    def test_all_scenes_have_mapping(self, prompt_for: _PromptFor, scene: Scene) -> None:
         """Every Scene value must produce a non-empty prompt."""
-        for scene in Scene:
-            req = ImageGenerationRequest(emotion=Emotion.neutral, scene=scene, affinity_level=50)
-            prompt = service.build_prompt(req)
-            assert len(prompt) > 0
+        prompt = prompt_for(Emotion.neutral, scene, 50)
+        assert len(prompt) > 0
 
-    def test_low_affinity_prompt(self, service: ImageGenerationService) -> None:
+    def test_low_affinity_prompt(self, prompt_for: _PromptFor) -> None:
         """Low affinity (0-30) should produce solo/formal tone."""
-        req = ImageGenerationRequest(emotion=Emotion.happy, scene=Scene.cafe, affinity_level=10)
-        prompt = service.build_prompt(req)
+        prompt = prompt_for(Emotion.happy, Scene.cafe, 10)
         assert "solo" in prompt
         assert any(word in prompt for word in ["formal", "reserved", "shy"])
 
-    def test_mid_affinity_prompt(self, service: ImageGenerationService) -> None:
+    def test_mid_affinity_prompt(self, prompt_for: _PromptFor) -> None:
         """Mid affinity (31-70) should produce friendly/warm tone."""
-        req = ImageGenerationRequest(emotion=Emotion.happy, scene=Scene.cafe, affinity_level=50)
-        prompt = service.build_prompt(req)
+        prompt = prompt_for(Emotion.happy, Scene.cafe, 50)
         assert any(word in prompt for word in ["friendly", "warm"])
 
-    def test_high_affinity_prompt(self, service: ImageGenerationService) -> None:
+    def test_high_affinity_prompt(self, prompt_for: _PromptFor) -> None:
         """High affinity (71-100) should produce intimate/close tone."""
-        req = ImageGenerationRequest(emotion=Emotion.happy, scene=Scene.cafe, affinity_level=100)
-        prompt = service.build_prompt(req)
+        prompt = prompt_for(Emotion.happy, Scene.cafe, 100)
         assert any(word in prompt for word in ["intimate", "viewer", "soft gaze"])
 
-    def test_affinity_boundary_30(self, service: ImageGenerationService) -> None:
+    def test_affinity_boundary_30(self, prompt_for: _PromptFor) -> None:
         """Affinity 30 should be low tier."""
-        req_30 = ImageGenerationRequest(emotion=Emotion.happy, scene=Scene.cafe, affinity_level=30)
-        req_31 = ImageGenerationRequest(emotion=Emotion.happy, scene=Scene.cafe, affinity_level=31)
-        assert service.build_prompt(req_30) != service.build_prompt(req_31)
+        assert prompt_for(Emotion.happy, Scene.cafe, 30) != prompt_for(Emotion.happy, Scene.cafe, 31)
 
-    def test_affinity_boundary_70(self, service: ImageGenerationService) -> None:
+    def test_affinity_boundary_70(self, prompt_for: _PromptFor) -> None:
         """Affinity 70 should be mid tier, 71 should be high tier."""
-        req_70 = ImageGenerationRequest(emotion=Emotion.happy, scene=Scene.cafe, affinity_level=70)
-        req_71 = ImageGenerationRequest(emotion=Emotion.happy, scene=Scene.cafe, affinity_level=71)
-        assert service.build_prompt(req_70) != service.build_prompt(req_71)
+        assert prompt_for(Emotion.happy, Scene.cafe, 70) != prompt_for(Emotion.happy, Scene.cafe, 71)
@@ -1,13 +1,16 @@
 """Tests for ImageGenerationService.generate_image() - Task 5.2."""
 import logging
+import tempfile
+from datetime import datetime, timedelta
 from pathlib import Path
-from unittest.mock import patch
+from types import SimpleNamespace
+from typing import NamedTuple, Optional, Union
 
 import pytest
 
 from app.models.conversation import Emotion, Scene
 from app.models.image import CharacterConfig, ImageGenerationRequest
-from app.services.image import ImageGenerationService
+from app.services.image import REFERENCE_MAX_AGE_DAYS, ImageGenerationService
 
 CHARACTER_CONFIG = CharacterConfig(
     name="Hana",
@@ -15,12 +18,72 @@ CHARACTER_CONFIG = CharacterConfig(
     appearance_prompt="anime style girl, long black hair, blue eyes, school uniform",
 )
 
+# Requests are only read by the service, so tests share these instances.
+_REQ_HAPPY_CAFE = ImageGenerationRequest(emotion=Emotion.happy, scene=Scene.cafe, affinity_level=50)
+_REQ_HAPPY_CAFE_LOW = ImageGenerationRequest(emotion=Emotion.happy, scene=Scene.cafe, affinity_level=10)
+_REQ_HAPPY_PARK = ImageGenerationRequest(emotion=Emotion.happy, scene=Scene.park, affinity_level=50)
+_REQ_SAD_CAFE = ImageGenerationRequest(emotion=Emotion.sad, scene=Scene.cafe, affinity_level=50)
+_REQ_SAD_INDOOR = ImageGenerationRequest(emotion=Emotion.sad, scene=Scene.indoor, affinity_level=20)
+_REQ_SAD_PARK = ImageGenerationRequest(emotion=Emotion.sad, scene=Scene.park, affinity_level=50)
+
+
+class _ApiCall(NamedTuple):
+    prompt: str
+    reference_image_bytes: Optional[bytes]
+
+
+class _ImageApiStub:
+    """Stand-in for _call_image_api that records each call's arguments.
+
+    Each call returns (or raises) the next of `results`; the last one repeats.
+    """
+
+    def __init__(self, *results: Union[bytes, Exception]) -> None:
+        self._results = results
+        self.calls: list[_ApiCall] = []
+
+    def __call__(self, prompt: str, reference_image_bytes: Optional[bytes] = None) -> bytes:
+        self.calls.append(_ApiCall(prompt, reference_image_bytes))
+        result = self._results[min(len(self.calls), len(self._results)) - 1]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+class _FakeReferencePath:
+    """In-memory stand-in for the reference.png Path: exists, has an mtime, has bytes."""
+
+    def __init__(self, data: bytes, age: timedelta) -> None:
+        self._data = data
+        self._mtime = (datetime.now() - age).timestamp()
+
+    def exists(self) -> bool:
+        return True
+
+    def stat(self) -> SimpleNamespace:
+        return SimpleNamespace(st_mtime=self._mtime)
+
+    def read_bytes(self) -> bytes:
+        return self._data
+
+
+def _stub_api(svc: ImageGenerationService, *results: Union[bytes, Exception]) -> _ImageApiStub:
+    """Replace svc._call_image_api on the instance; each test owns its service."""
+    api = _ImageApiStub(*results)
+    svc._call_image_api = api  # type: ignore[method-assign]
+    return api
+
+
+@pytest.fixture(scope="module")
+def images_root(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """One temp directory for the module; tests get their own subdirectory in it."""
+    return tmp_path_factory.mktemp("images")
+
 
 @pytest.fixture
-def images_dir(tmp_path: Path) -> Path:
-    d = tmp_path / "images"
-    d.mkdir()
-    return d
+def images_dir(images_root: Path) -> Path:
+    # mkdtemp picks a fresh name, so same-named tests in different classes never clash
+    return Path(tempfile.mkdtemp(dir=images_root))
 
 
 @pytest.fixture
@@ -38,16 +101,14 @@ class TestGenerateImage:
 
     def test_returns_file_path_string(self, service: ImageGenerationService) -> None:
         """generate_image should return a str file path on success."""
-        req = ImageGenerationRequest(emotion=Emotion.happy, scene=Scene.cafe, affinity_level=50)
-        with patch.object(service, "_call_image_api", return_value=b"png_data"):
-            result = service.generate_image(req)
+        _stub_api(service, b"png_data")
+        result = service.generate_image(_REQ_HAPPY_CAFE)
         assert isinstance(result, str)
 
     def test_file_has_png_extension(self, service: ImageGenerationService) -> None:
         """Returned file path must end with .png."""
-        req = ImageGenerationRequest(emotion=Emotion.happy, scene=Scene.cafe, affinity_level=50)
-        with patch.object(service, "_call_image_api", return_value=b"png_data"):
-            result = service.generate_image(req)
+        _stub_api(service, b"png_data")
+        result = service.generate_image(_REQ_HAPPY_CAFE)
         assert result is not None
         assert result.endswith(".png")
 
@@ -55,18 +116,16 @@ class TestGenerateImage:
         self, service: ImageGenerationService
     ) -> None:
         """Filename must follow {emotion}_{scene}_{timestamp}.png convention."""
-        req = ImageGenerationRequest(emotion=Emotion.happy, scene=Scene.park, affinity_level=50)
-        with patch.object(service, "_call_image_api", return_value=b"png_data"):
-            result = service.generate_image(req)
+        _stub_api(service, b"png_data")
+        result = service.generate_image(_REQ_HAPPY_PARK)
         assert result is not None
         filename = Path(result).name
         assert filename.startswith("happy_park_")
 
     def test_filename_timestamp_is_14_digits(self, service: ImageGenerationService) -> None:
         """Timestamp part of filename must be 14 digits (YYYYMMDDHHMMSS)."""
-        req = ImageGenerationRequest(emotion=Emotion.sad, scene=Scene.indoor, affinity_level=20)
-        with patch.object(service, "_call_image_api", return_value=b"png_data"):
-            result = service.generate_image(req)
+        _stub_api(service, b"png_data")
+        result = service.generate_image(_REQ_SAD_INDOOR)
         assert result is not None
         stem = Path(result).stem  # e.g. "sad_indoor_20260223120000"
         # emotion and scene have no underscore, so split on first two '_' safely
@@ -80,10 +139,9 @@ class TestGenerateImage:
         self, service: ImageGenerationService
     ) -> None:
         """Image bytes must be written to disk; returned value is a URL path."""
-        req = ImageGenerationRequest(emotion=Emotion.happy, scene=Scene.cafe, affinity_level=50)
         image_bytes = b"\x89PNG_fake_data"
-        with patch.object(service, "_call_image_api", return_value=image_bytes):
-            result = service.generate_image(req)
+        _stub_api(service, image_bytes)
+        result = service.generate_image(_REQ_HAPPY_CAFE)
         assert result is not None
         # Result is a URL path like "/images/happy_cafe_xxx.png"
         assert result.startswith("/images/")
@@ -103,69 +161,51 @@ class TestGenerateImage:
             location="us-central1",
             images_dir=missing_dir,
         )
-        req = ImageGenerationRequest(emotion=Emotion.happy, scene=Scene.cafe, affinity_level=50)
-        with patch.object(svc, "_call_image_api", return_value=b"png_data"):
-            result = svc.generate_image(req)
+        _stub_api(svc, b"png_data")
+        result = svc.generate_image(_REQ_HAPPY_CAFE)
         assert missing_dir.exists()
         assert result is not None
 
     def test_retries_exactly_once_on_api_error(self, service: ImageGenerationService) -> None:
         """On API error, _call_image_api is called a total of 2 times (original + 1 retry)."""
-        req = ImageGenerationRequest(emotion=Emotion.happy, scene=Scene.cafe, affinity_level=50)
-        call_count = 0
-
-        def always_fails(*_args: object, **_kwargs: object) -> bytes:
-            nonlocal call_count
-            call_count += 1
-            raise RuntimeError("API error")
-
-        with patch.object(service, "_call_image_api", side_effect=always_fails):
-            service.generate_image(req)
-        assert call_count == 2
+        api = _stub_api(service, RuntimeError("API error"))
+        service.generate_image(_REQ_HAPPY_CAFE)
+        assert len(api.calls) == 2
 
     def test_returns_none_after_both_attempts_fail(self, service: ImageGenerationService) -> None:
         """Returns None when both the original attempt and retry fail."""
-        req = ImageGenerationRequest(emotion=Emotion.happy, scene=Scene.cafe, affinity_level=50)
-        with patch.object(service, "_call_image_api", side_effect=RuntimeError("API error")):
-            result = service.generate_image(req)
+        _stub_api(service, RuntimeError("API error"))
+        result = service.generate_image(_REQ_HAPPY_CAFE)
         assert result is None
 
     def test_returns_path_when_retry_succeeds(self, service: ImageGenerationService) -> None:
         """Returns a valid file path when the retry (second attempt) succeeds."""
-        req = ImageGenerationRequest(emotion=Emotion.happy, scene=Scene.cafe, affinity_level=50)
-        call_count = 0
-
-        def fail_then_succeed(*_args: object, **_kwargs: object) -> bytes:
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:
-                raise RuntimeError("first attempt fails")
-            return b"png_data"
-
-        with patch.object(service, "_call_image_api", side_effect=fail_then_succeed):
-            result = service.generate_image(req)
-        assert call_count == 2
+        api = _stub_api(service, RuntimeError("first attempt fails"), b"png_data")
+        result = service.generate_image(_REQ_HAPPY_CAFE)
+        assert len(api.calls) == 2
         assert result is not None
         assert result.endswith(".png")
 
-    def test_logs_error_on_each_failed_attempt(
-        self, service: ImageGenerationService, caplog: pytest.LogCaptureFixture
-    ) -> None:
+    def test_logs_error_on_each_failed_attempt(self, service: ImageGenerationService) -> None:
         """An ERROR log must be emitted for each failed API attempt."""
-        req = ImageGenerationRequest(emotion=Emotion.happy, scene=Scene.cafe, affinity_level=50)
-        with caplog.at_level(logging.ERROR):
-            with patch.object(service, "_call_image_api", side_effect=RuntimeError("boom")):
-                service.generate_image(req)
-        error_records = [r for r in caplog.records if r.levelno == logging.ERROR]
-        assert len(error_records) >= 1
+        records: list[logging.LogRecord] = []
+        handler = logging.Handler(level=logging.ERROR)
+        handler.emit = records.append  # type: ignore[method-assign]
+        image_logger = logging.getLogger("app.services.image")
+        _stub_api(service, RuntimeError("boom"))
+        image_logger.addHandler(handler)
+        try:
+            service.generate_image(_REQ_HAPPY_CAFE)
+        finally:
+            image_logger.removeHandler(handler)
+        assert len(records) == 2
 
     def test_no_file_created_when_generation_fails(
         self, service: ImageGenerationService, images_dir: Path
     ) -> None:
         """No PNG file should exist in images_dir when generation fails."""
-        req = ImageGenerationRequest(emotion=Emotion.happy, scene=Scene.cafe, affinity_level=50)
-        with patch.object(service, "_call_image_api", side_effect=RuntimeError("API error")):
-            service.generate_image(req)
+        _stub_api(service, RuntimeError("API error"))
+        service.generate_image(_REQ_HAPPY_CAFE)
         png_files = list(images_dir.glob("*.png"))
         assert len(png_files) == 0
 
@@ -177,43 +217,36 @@ class TestReferenceImage:
         self, service: ImageGenerationService, images_dir: Path
     ) -> None:
         """First successful generation must save reference.png to images_dir."""
-        req = ImageGenerationRequest(emotion=Emotion.happy, scene=Scene.cafe, affinity_level=50)
-        with patch.object(service, "_call_image_api", return_value=b"png_data"):
-            service.generate_image(req)
+        _stub_api(service, b"png_data")
+        service.generate_image(_REQ_HAPPY_CAFE)
         assert (images_dir / "reference.png").exists()
 
     def test_reference_image_bytes_set_after_first_generation(
         self, service: ImageGenerationService
     ) -> None:
         """_reference_image_bytes must be populated after the first generation."""
-        req = ImageGenerationRequest(emotion=Emotion.happy, scene=Scene.cafe, affinity_level=50)
         assert service._reference_image_bytes is None
-        with patch.object(service, "_call_image_api", return_value=b"png_data"):
-            service.generate_image(req)
+        _stub_api(service, b"png_data")
+        service.generate_image(_REQ_HAPPY_CAFE)
         assert service._reference_image_bytes == b"png_data"
 
     def test_first_generation_passes_none_as_reference(
         self, service: ImageGenerationService
     ) -> None:
         """_call_image_api must receive None for reference_image_bytes on the first call."""
-        req = ImageGenerationRequest(emotion=Emotion.happy, scene=Scene.cafe, affinity_level=50)
-        with patch.object(service, "_call_image_api", return_value=b"png_data") as mock_api:
-            service.generate_image(req)
-        # _call_image_api(prompt, reference_image_bytes) — second positional arg is None on first call
-        assert mock_api.call_args.args[1] is None
+        api = _stub_api(service, b"png_data")
+        service.generate_image(_REQ_HAPPY_CAFE)
+        assert api.calls[0].reference_image_bytes is None
 
     def test_second_generation_passes_reference_bytes_to_api(
         self, service: ImageGenerationService
     ) -> None:
         """After the first generation, subsequent calls must pass reference bytes to API."""
-        req1 = ImageGenerationRequest(emotion=Emotion.happy, scene=Scene.cafe, affinity_level=50)
-        req2 = ImageGenerationRequest(emotion=Emotion.sad, scene=Scene.park, affinity_level=50)
-        with patch.object(service, "_call_image_api", return_value=b"ref_bytes"):
-            service.generate_image(req1)
-        with patch.object(service, "_call_image_api", return_value=b"new_bytes") as mock_api2:
-            service.generate_image(req2)
-        # _call_image_api(prompt, reference_image_bytes) — second positional arg is the reference
-        assert mock_api2.call_args.args[1] == b"ref_bytes"
+        _stub_api(service, b"ref_bytes")
+        service.generate_image(_REQ_HAPPY_CAFE)
+        api = _stub_api(service, b"new_bytes")
+        service.generate_image(_REQ_SAD_PARK)
+        assert api.calls[0].reference_image_bytes == b"ref_bytes"
 
     def test_reference_loaded_from_disk_on_init(
         self, images_dir: Path
@@ -229,25 +262,37 @@ class TestReferenceImage:
         )
         assert svc._reference_image_bytes == ref_bytes
 
+    @pytest.mark.parametrize(
+        ("age", "expected"),
+        [
+            (timedelta(days=1), b"existing_reference"),
+            (timedelta(days=REFERENCE_MAX_AGE_DAYS), None),
+        ],
+        ids=["fresh", "expired"],
+    )
+    def test_load_reference_image_respects_max_age(
+        self, service: ImageGenerationService, age: timedelta, expected: Optional[bytes]
+    ) -> None:
+        """_load_reference_image returns stored bytes only while younger than the max age."""
+        service._reference_image_path = _FakeReferencePath(b"existing_reference", age)  # type: ignore[assignment]
+        assert service._load_reference_image() == expected
+
     def test_reference_not_overwritten_on_second_generation(
         self, service: ImageGenerationService, images_dir: Path
     ) -> None:
         """reference.png must only be written once (on first generation)."""
-        req1 = ImageGenerationRequest(emotion=Emotion.happy, scene=Scene.cafe, affinity_level=50)
-        req2 = ImageGenerationRequest(emotion=Emotion.sad, scene=Scene.park, affinity_level=50)
-        with patch.object(service, "_call_image_api", return_value=b"first"):
-            service.generate_image(req1)
-        with patch.object(service, "_call_image_api", return_value=b"second"):
-            service.generate_image(req2)
+        _stub_api(service, b"first")
+        service.generate_image(_REQ_HAPPY_CAFE)
+        _stub_api(service, b"second")
+        service.generate_image(_REQ_SAD_PARK)
         assert (images_dir / "reference.png").read_bytes() == b"first"
 
     def test_reference_not_saved_when_generation_fails(
         self, service: ImageGenerationService, images_dir: Path
     ) -> None:
         """reference.png must not be created when image generation fails."""
-        req = ImageGenerationRequest(emotion=Emotion.happy, scene=Scene.cafe, affinity_level=50)
-        with patch.object(service, "_call_image_api", side_effect=RuntimeError("fail")):
-            service.generate_image(req)
+        _stub_api(service, RuntimeError("fail"))
+        service.generate_image(_REQ_HAPPY_CAFE)
         assert not (images_dir / "reference.png").exists()
         assert service._reference_image_bytes is None
 
@@ -255,71 +300,40 @@ class TestReferenceImage:
         self, service: ImageGenerationService
     ) -> None:
         """Without reference, prompt must contain the character's appearance_prompt."""
-        req = ImageGenerationRequest(emotion=Emotion.happy, scene=Scene.cafe, affinity_level=50)
-        prompt = service.build_prompt(req, has_reference=False)
+        prompt = service.build_prompt(_REQ_HAPPY_CAFE, has_reference=False)
         assert CHARACTER_CONFIG.appearance_prompt in prompt
 
     def test_build_prompt_with_reference_instructs_keep_appearance(
         self, service: ImageGenerationService
     ) -> None:
         """With reference, prompt must instruct to keep the character's appearance unchanged."""
-        req = ImageGenerationRequest(emotion=Emotion.happy, scene=Scene.cafe, affinity_level=50)
-        prompt = service.build_prompt(req, has_reference=True)
+        prompt = service.build_prompt(_REQ_HAPPY_CAFE, has_reference=True)
         assert "exactly as shown in the reference image" in prompt
 
 
 class TestImageCache:
     """Tests for in-memory (emotion, scene) cache in generate_image()."""
 
-    def test_cache_hit_skips_api_call(
-        self, service: ImageGenerationService
-    ) -> None:
-        """Second call with same emotion+scene must not invoke the API."""
-        req = ImageGenerationRequest(emotion=Emotion.happy, scene=Scene.cafe, affinity_level=50)
-        with patch.object(service, "_call_image_api", return_value=b"png") as mock_api:
-            service.generate_image(req)
-            service.generate_image(req)
-        mock_api.assert_called_once()
-
-    def test_cache_hit_returns_same_path(
-        self, service: ImageGenerationService
-    ) -> None:
-        """Cached call must return the same path as the original generation."""
-        req = ImageGenerationRequest(emotion=Emotion.happy, scene=Scene.cafe, affinity_level=50)
-        with patch.object(service, "_call_image_api", return_value=b"png"):
-            first = service.generate_image(req)
-            second = service.generate_image(req)
-        assert first == second
-
-    def test_different_emotion_generates_new_image(
-        self, service: ImageGenerationService
-    ) -> None:
-        """Different emotion = different cache key = new API call."""
-        req_happy = ImageGenerationRequest(emotion=Emotion.happy, scene=Scene.cafe, affinity_level=50)
-        req_sad = ImageGenerationRequest(emotion=Emotion.sad, scene=Scene.cafe, affinity_level=50)
-        with patch.object(service, "_call_image_api", return_value=b"png") as mock_api:
-            service.generate_image(req_happy)
-            service.generate_image(req_sad)
-        assert mock_api.call_count == 2
-
-    def test_different_scene_generates_new_image(
-        self, service: ImageGenerationService
-    ) -> None:
-        """Different scene = different cache key = new API call."""
-        req_cafe = ImageGenerationRequest(emotion=Emotion.happy, scene=Scene.cafe, affinity_level=50)
-        req_park = ImageGenerationRequest(emotion=Emotion.happy, scene=Scene.park, affinity_level=50)
-        with patch.object(service, "_call_image_api", return_value=b"png") as mock_api:
-            service.generate_image(req_cafe)
-            service.generate_image(req_park)
-        assert mock_api.call_count == 2
-
-    def test_affinity_change_uses_cache(
-        self, service: ImageGenerationService
+    @pytest.mark.parametrize(
+        ("first_req", "second_req", "expected_calls"),
+        [
+            (_REQ_HAPPY_CAFE, _REQ_HAPPY_CAFE, 1),
+            (_REQ_HAPPY_CAFE_LOW, _REQ_HAPPY_CAFE, 1),
+            (_REQ_HAPPY_CAFE, _REQ_SAD_CAFE, 2),
+            (_REQ_HAPPY_CAFE, _REQ_HAPPY_PARK, 2),
+        ],
+        ids=["same_request", "affinity_change_only", "different_emotion", "different_scene"],
+    )
+    def test_cache_keyed_on_emotion_and_scene(
+        self,
+        service: ImageGenerationService,
+        first_req: ImageGenerationRequest,
+        second_req: ImageGenerationRequest,
+        expected_calls: int,
     ) -> None:
-        """Affinity change alone does not bust the cache (same emotion+scene)."""
-        req1 = ImageGenerationRequest(emotion=Emotion.happy, scene=Scene.cafe, affinity_level=10)
-        req2 = ImageGenerationRequest(emotion=Emotion.happy, scene=Scene.cafe, affinity_level=50)
-        with patch.object(service, "_call_image_api", return_value=b"png") as mock_api:
-            service.generate_image(req1)
-            service.generate_image(req2)
-        mock_api.assert_called_once()
+        """Same emotion+scene reuses the cached path without an API call; others regenerate."""
+        api = _stub_api(service, b"png")
+        first = service.generate_image(first_req)
+        second = service.generate_image(second_req)
+        assert len(api.calls) == expected_calls
+        assert (first == second) is (expected_calls == 1)
@@ -10,7 +10,6 @@ Usage:
 """
 
 import argparse
-import json
 import os
 import sys
 from pathlib import Path
@@ -20,13 +19,8 @@ _BACKEND_PATH = Path(__file__).parent.parent / "backend"
 if str(_BACKEND_PATH) not in sys.path:
     sys.path.insert(0, str(_BACKEND_PATH))
 
-import vertexai
-from vertexai.agent_engines import AdkApp
-
 from app.core.config import get_settings
 from app.models.image import CharacterConfig
-from app.services.agent import build_agent
-from app.services.agent_tools import initialize_session, save_to_memory
 
 # Agent Engine へのデプロイに必要なパッケージ
 REQUIREMENTS = [
@@ -40,12 +34,12 @@ _CHARACTER_JSON_PATH = Path(__file__).parent.parent / "data" / "characters" / "c
 def load_character_config() -> CharacterConfig:
     """data/characters/character.json からキャラクター設定を読み込む。
 
+    バイト列をそのまま pydantic に渡して検証する。
+
     Returns:
         CharacterConfig インスタンス。
     """
-    with open(_CHARACTER_JSON_PATH, encoding="utf-8") as f:
-        data = json.load(f)
-    return CharacterConfig(**data)
+    return CharacterConfig.model_validate_json(_CHARACTER_JSON_PATH.read_bytes())
 
 
 def deploy(update: bool = False) -> None:
@@ -55,6 +49,13 @@ def deploy(update: bool = False) -> None:
         update: True の場合、既存デプロイを更新する（コード変更後の再デプロイ）。
                 False の場合（デフォルト）、新規デプロイを実行する。
     """
+    # Vertex AI SDK / ADK の import は重いため、--help などで不要に読み込まないよう遅延させる
+    import vertexai
+    from vertexai.agent_engines import AdkApp
+
+    from app.services.agent import build_agent
+    from app.services.agent_tools import initialize_session, save_to_memory
+
     settings = get_settings()
 
     vertexai.init(